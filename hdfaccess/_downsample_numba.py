@@ -0,0 +1,87 @@
+'''
+Numba kernels for downsample, used when numba is installed. See hdfaccess.downsample._numba_bucket_extremes.
+'''
+import numpy as np
+
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def float_bucket_extremes(data, bucket_size, minimums, maximums):
+    '''
+    Numba kernel for floating point data, ignoring NaN and inf values as masked_invalid does. The minimum and
+    maximum values of each bucket are found with branchless selects, which the compiler can turn into min/max
+    instructions, then the first index of each is found. Buckets without a valid value use the index of their
+    first value, matching argmin/argmax of a fully masked array.
+    '''
+    for bucket in prange(minimums.size):
+        start = bucket * bucket_size
+        stop = min(start + bucket_size, data.size)
+        lo_value = np.inf
+        hi_value = -np.inf
+        for index in range(start, stop):
+            value = data[index]
+            # NaN fails both comparisons, inf and -inf are excluded explicitly
+            lo_value = value if value < lo_value and value != -np.inf else lo_value
+            hi_value = value if value > hi_value and value != np.inf else hi_value
+        lo = hi = start
+        if lo_value <= hi_value:
+            while data[lo] != lo_value:
+                lo += 1
+            while data[hi] != hi_value:
+                hi += 1
+        minimums[bucket] = lo
+        maximums[bucket] = hi
+
+
+@njit(parallel=True, cache=True)
+def integer_bucket_extremes(data, bucket_size, minimums, maximums):
+    '''
+    Numba kernel for integer data, where every value is valid. The indexes of the minimum and maximum of each bucket
+    are updated with branchless selects in a single pass.
+    '''
+    for bucket in prange(minimums.size):
+        start = bucket * bucket_size
+        stop = min(start + bucket_size, data.size)
+        lo = hi = start
+        lo_value = hi_value = data[start]
+        for index in range(start + 1, stop):
+            value = data[index]
+            smaller = value < lo_value
+            larger = value > hi_value
+            lo = index if smaller else lo
+            lo_value = value if smaller else lo_value
+            hi = index if larger else hi
+            hi_value = value if larger else hi_value
+        minimums[bucket] = lo
+        maximums[bucket] = hi
+
+
+@njit(parallel=True, cache=True)
+def masked_bucket_extremes(data, mask, bucket_size, minimums, maximums):
+    '''
+    Numba kernel for masked integer or floating point data, reading each value and its mask in the same pass
+    rather than masking invalid values and reducing the masked array separately. Masked, NaN and inf values are
+    ignored. Buckets without a valid value use the index of their first value, matching argmin/argmax of a fully
+    masked array.
+    '''
+    for bucket in prange(minimums.size):
+        start = bucket * bucket_size
+        stop = min(start + bucket_size, data.size)
+        lo = hi = -1
+        for index in range(start, stop):
+            if mask[index]:
+                continue
+            value = data[index]
+            if not np.isfinite(value):
+                continue
+            if lo < 0:
+                lo = hi = index
+            elif value < data[lo]:
+                lo = index
+            elif value > data[hi]:
+                hi = index
+        if lo < 0:
+            lo = hi = start
+        minimums[bucket] = lo
+        maximums[bucket] = hi
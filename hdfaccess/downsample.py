@@ -1,25 +1,235 @@
 import numpy as np
 
+try:
+    from hdfaccess import _downsample_numba
+except ImportError:  # numba is optional, downsample falls back to numpy
+    _downsample_numba = None
+
 
 SAMPLES_PER_BUCKET = 2
 
+# The kind of data downsampling handles for each type, looked up by type rather than with a chain of isinstance
+# checks. Subclasses, e.g. MappedArray, are added on first use by _data_kind.
+DATA_KINDS = {
+    list: 'sequence',
+    tuple: 'sequence',
+    np.ndarray: 'array',
+    np.ma.MaskedArray: 'masked',
+}
 
-def masked_invalid(data):
+# Eight masked values of a boolean mask viewed as a single 64-bit word.
+ALL_MASKED_WORD = np.uint64(0x0101010101010101)
+
+# Approximate number of bytes of data reduced at a time, small enough for the temporary copies to stay in cache.
+TILE_BYTES = 256 * 1024
+
+
+def _data_kind(data):
+    '''
+    Return the kind of data from DATA_KINDS, 'sequence', 'array' or 'masked', or None for other types.
+    '''
+    data_type = type(data)
     try:
+        return DATA_KINDS[data_type]
+    except KeyError:
+        pass
+    for cls in data_type.__mro__[1:]:
+        if cls in DATA_KINDS:
+            DATA_KINDS[data_type] = DATA_KINDS[cls]
+            return DATA_KINDS[cls]
+    return None
+
+
+def masked_invalid(data):
+    '''
+    Mask NaN and inf values so they are ignored by argmin/argmax. Only floating point (and complex) data can hold
+    invalid values, so other data, e.g. integers, strings and already masked integers, is returned unchanged rather
+    than copied.
+    '''
+    if np.issubdtype(data.dtype, np.inexact):
         return np.ma.masked_invalid(data)
-    except TypeError:
-        return data # isfinite not supported for input type, e.g. string
+    return data
+
+
+def _masked_buckets(mask, bucket_size):
+    '''
+    Flag the buckets of a boolean mask which are entirely masked and those which contain any masked values. Returns
+    two boolean arrays with a value per bucket.
+    '''
+    size = len(mask)
+    if bucket_size % 8 == 0 and mask.flags.c_contiguous:
+        # check eight mask values at a time by viewing the whole buckets as 64-bit words
+        regular_size = size - size % bucket_size
+        words = mask[:regular_size].view(np.uint64).reshape(-1, bucket_size // 8)
+        all_masked = (words == ALL_MASKED_WORD).all(axis=1)
+        any_masked = words.any(axis=1)
+        if regular_size < size:
+            remainder_part = mask[regular_size:]
+            all_masked = np.append(all_masked, remainder_part.all())
+            any_masked = np.append(any_masked, remainder_part.any())
+        return all_masked, any_masked
+
+    # count the masked values of each bucket in a single pass
+    starts = np.arange(0, size, bucket_size)
+    masked_counts = np.add.reduceat(mask, starts, dtype=np.intp)
+    bucket_sizes = np.full(len(starts), bucket_size)
+    bucket_sizes[-1] = size - starts[-1]
+    return masked_counts == bucket_sizes, masked_counts > 0
+
+
+def _unreduced(data, data_kind, bucket_size):
+    '''
+    Whether downsampling data would return it unchanged: every bucket holds exactly SAMPLES_PER_BUCKET values and
+    none of them are masked or invalid, so each bucket keeps all of its values in order.
+    '''
+    size = len(data)
+    if bucket_size < SAMPLES_PER_BUCKET or not (size == SAMPLES_PER_BUCKET or
+                                                (bucket_size == SAMPLES_PER_BUCKET and size % bucket_size == 0)):
+        return False
+    if data_kind == 'masked' and np.ma.getmask(data).any():
+        return False
+    return not np.issubdtype(data.dtype, np.inexact) or bool(np.isfinite(np.ma.getdata(data)).all())
+
+
+def _first_valid(valid, indexes):
+    '''
+    Correct indexes of the minimum or maximum of each row of reshaped integer data which point at a masked value,
+    replaced by the fill value, although the row has valid values. Every valid value of such a row equals the fill
+    value, so the first valid value is the extreme.
+    '''
+    fix = ~valid[np.arange(len(indexes)), indexes] & valid.any(axis=1)
+    if fix.any():
+        indexes[fix] = valid[fix].argmax(axis=1)
 
 
-def downsample(data, bucket_size, point_size=1):
+def _numba_bucket_extremes(data, bucket_size, minimums, maximums, mask=None):
+    '''
+    Store the index of the minimum and maximum of each bucket of an integer or floating point array in minimums and
+    maximums, using the numba kernel for the dtype, or for the mask if given.
+    '''
+    if mask is not None:
+        _downsample_numba.masked_bucket_extremes(data, mask, bucket_size, minimums, maximums)
+    elif data.dtype.kind == 'f':
+        _downsample_numba.float_bucket_extremes(data, bucket_size, minimums, maximums)
+    else:
+        _downsample_numba.integer_bucket_extremes(data, bucket_size, minimums, maximums)
+
+
+# Reduces numeric arrays with the numba kernels, or None if numba is not installed.
+_bucket_extremes = None if _downsample_numba is None else _numba_bucket_extremes
+
+# The native byte order dtypes reduced with the numba kernels. Other dtypes, e.g. float16 or big-endian data read
+# from a file, are reduced with numpy.
+NUMBA_DTYPES = frozenset(np.dtype(dtype) for dtype in (np.float32, np.float64, np.int16, np.int64, np.uint8))
+
+
+def _downsample_indexes(data, bucket_size):
+    '''
+    Calculate the indexes of the minimum and maximum of each bucket of data. Returns two arrays, the minimum indexes
+    and the maximum indexes.
+    '''
+    data_kind = _data_kind(data)
+    if _bucket_extremes is not None and data_kind in ('array', 'masked') and data.dtype in NUMBA_DTYPES:
+        # numeric arrays, masked or not, can be reduced in a single pass with the numba kernels
+        bucket_count = -(-len(data) // bucket_size)
+        minimums = np.empty(bucket_count, dtype=np.intp)
+        maximums = np.empty(bucket_count, dtype=np.intp)
+        mask = np.ma.getmaskarray(data) if data_kind == 'masked' else None
+        _bucket_extremes(np.ma.getdata(data), bucket_size, minimums, maximums, mask=mask)
+        return minimums, maximums
+
+    size = len(data)
+    bucket_count = -(-size // bucket_size)
+    minimums = np.empty(bucket_count, dtype=np.intp)
+    maximums = np.empty(bucket_count, dtype=np.intp)
+
+    numeric = data.dtype.kind in 'iuf'
+    if numeric:
+        # rather than reducing masked arrays, replace masked and invalid values with the fill values np.ma would use,
+        # the largest value for argmin and the smallest for argmax, and reduce plain arrays
+        values = np.ma.getdata(data)
+        mask = np.ma.getmask(data)
+        floating = data.dtype.kind == 'f'
+        if floating:
+            minimum_fill, maximum_fill = np.inf, -np.inf
+        else:
+            info = np.iinfo(data.dtype)
+            minimum_fill, maximum_fill = info.max, info.min
+
+    # work through tiles of whole buckets so that masking invalid values and reducing stays within the cache
+    tile_size = max(1, TILE_BYTES // (bucket_size * data.itemsize)) * bucket_size
+    for start in range(0, size, tile_size):
+        if numeric:
+            tile = values[start:start + tile_size]
+            valid = np.isfinite(tile) if floating else None
+            if mask is not np.ma.nomask:
+                unmasked = ~mask[start:start + tile_size]
+                valid = unmasked if valid is None else valid & unmasked
+            if valid is None:
+                minimum_tile = maximum_tile = tile
+            else:
+                minimum_tile = np.where(valid, tile, minimum_fill)
+                maximum_tile = np.where(valid, tile, maximum_fill)
+        else:
+            minimum_tile = maximum_tile = masked_invalid(data[start:start + tile_size])
+        first = start // bucket_size
+        # unfortunately, numpy can't deal with irregular array sizes, so we need to split the data set
+        tile_length = len(minimum_tile)
+        regular_size = tile_length - tile_length % bucket_size
+        # masked integers may equal the fill value, so their indexes are checked against the valid values
+        fill_ties = numeric and not floating and valid is not None
+        if regular_size:
+            stop = first + regular_size // bucket_size
+            minimum_tile[:regular_size].reshape(-1, bucket_size).argmin(axis=1, out=minimums[first:stop])
+            maximum_tile[:regular_size].reshape(-1, bucket_size).argmax(axis=1, out=maximums[first:stop])
+            if fill_ties:
+                valid_buckets = valid[:regular_size].reshape(-1, bucket_size)
+                _first_valid(valid_buckets, minimums[first:stop])
+                _first_valid(valid_buckets, maximums[first:stop])
+        if regular_size < tile_length:
+            minimums[-1] = minimum_tile[regular_size:].argmin()
+            maximums[-1] = maximum_tile[regular_size:].argmax()
+            if fill_ties:
+                valid_bucket = valid[regular_size:].reshape(1, -1)
+                _first_valid(valid_bucket, minimums[-1:])
+                _first_valid(valid_bucket, maximums[-1:])
+
+    beginnings = np.arange(0, size, bucket_size, dtype=np.intp)
+    minimums += beginnings
+    maximums += beginnings
+    return minimums, maximums
+
+
+def _take(data, indexes, out=None):
+    '''
+    Gather the values of data at indexes, into out if given.
+    '''
+    if out is None:
+        return data[indexes]
+    if out.shape != indexes.shape or out.dtype != data.dtype or np.ma.isMaskedArray(out) != np.ma.isMaskedArray(data):
+        raise ValueError('out must be a%s array of shape %s and dtype %s' % (
+            ' masked' if np.ma.isMaskedArray(data) else 'n unmasked', indexes.shape, data.dtype))
+    np.take(data, indexes, out=out)
+    return out
+
+
+def downsample(data, bucket_size, point_size=1, interleave=True, out=None):
     '''
     Data-processing helper for downsampling consecutive data.  bucket_size is number of consecutive points to coalesce
     into one bucket. point_size is the number of values for each point (used when downsampling already downsampled
     data). Result is array (sorted on x) with beginning1, min1, max1, beginning2, ...
+
+    If interleave is False, the result is instead a tuple of two arrays, the minimum and the maximum of each bucket.
+
+    out is an optional array to store the interleaved result in, e.g. to reuse a buffer when repeatedly downsampling
+    to the same size. It must have the length and dtype of the result and be masked if data is masked. It is not used
+    when there is nothing to reduce and data is returned unchanged.
     '''
+    if out is not None and not interleave:
+        raise ValueError('out is only supported for the interleaved result')
 
     if bucket_size == 1 and point_size > 1:  # easy
-        return data
+        return data if interleave else (data, data)
 
     if point_size > 1:
         # actually, for already downsampled data we could just compute minimum (similar for max) over the already
@@ -28,21 +238,46 @@ def downsample(data, bucket_size, point_size=1):
         # already downsampled data as if the buckets were larger
         bucket_size *= point_size
 
-    # unfortunately, numpy can't deal with irregular array sizes, so we need to split the data set
-    remainder = len(data) % bucket_size
-    regular_part = masked_invalid(data[:len(data) - remainder])
+    data_kind = _data_kind(data)
+    if data_kind == 'sequence':
+        data = np.asarray(data)
+        data_kind = 'array'
+
+    if interleave and _unreduced(data, data_kind, bucket_size):
+        # there is nothing to reduce
+        return data
+
+    if not interleave and data_kind == 'array' and data.dtype.kind in 'iu' and len(data):
+        # integer data has no invalid values to ignore, so the separate minimums and maximums can be reduced directly
+        # without finding their indexes. reduceat also handles a shorter last bucket.
+        starts = np.arange(0, len(data), bucket_size)
+        return np.minimum.reduceat(data, starts), np.maximum.reduceat(data, starts)
 
-    # first calculate the indexes of all the numbers we want
-    minimums = regular_part.reshape(-1, bucket_size).argmin(axis=1)
-    maximums = regular_part.reshape(-1, bucket_size).argmax(axis=1)
-    if remainder:
-        remainder_part = masked_invalid(data[len(data) - remainder:])
-        minimums = np.concatenate((minimums, [remainder_part.argmin()]))
-        maximums = np.concatenate((maximums, [remainder_part.argmax()]))
+    values = data
+    if data_kind == 'masked':
+        mask = np.ma.getmask(data)
+        if mask is np.ma.nomask:
+            values = np.ma.getdata(data)
+        elif len(data):
+            # find the cheap cases from the masked buckets
+            all_masked, any_masked = _masked_buckets(mask, bucket_size)
+            if not any_masked.any():
+                # nothing is masked, so work on the plain data
+                values = np.ma.getdata(data)
+            elif all_masked.all():
+                # everything is masked, so each bucket is represented by its first (masked) value
+                starts = np.arange(0, len(data), bucket_size)
+                if not interleave:
+                    return data[starts], data[starts]
+                return _take(data, np.repeat(starts, 2), out=out)
 
-    beginnings = np.arange(0, len(minimums) * bucket_size, bucket_size, dtype=minimums.dtype)
+    minimums, maximums = _downsample_indexes(values, bucket_size)
+    if not interleave:
+        return data[minimums], data[maximums]
 
-    # zip the indexes together
-    indexes = np.column_stack((minimums + beginnings, maximums + beginnings)).reshape((-1,))
-    indexes.sort()
-    return data[indexes]
+    # zip the indexes together, the earlier index of each bucket first. Buckets do not overlap so the result is
+    # already sorted.
+    indexes = np.empty(2 * len(minimums), dtype=minimums.dtype)
+    np.minimum(minimums, maximums, out=indexes[0::2])
+    np.maximum(minimums, maximums, out=indexes[1::2])
+    return _take(data, indexes, out=out)
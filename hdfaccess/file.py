@@ -1,5 +1,3 @@
-from __future__ import print_function
-
 import base64
 import collections
 import logging
@@ -9,7 +7,6 @@ import os
 import pickle
 import re
 import simplejson
-import six
 import zlib
 import pytz
 
@@ -58,7 +55,7 @@ class hdf_file(object):    # rare case of lower case?!
         return self.__repr__().lstrip('<').rstrip('>')
 
     def __init__(self, file_path_or_obj, cache_param_list=False, create=False,
-                 read_only=False):
+                 read_only=False, **kwargs):
         '''
         Opens an HDF file (or accepts and already open h5py.File object) - will
         create if does not exist if create=True!
@@ -66,9 +63,12 @@ class hdf_file(object):    # rare case of lower case?!
         :param cache_param_list: Names of parameters to cache where accessed. A value of True will result in all parameters to be cached.
         :type cache_param_list: [str] or bool
         :param file_path_or_obj: Can be either the path to an HDF file or an already opened HDF file object.
-        :type file_path_or_obj: str or h5py.File
+        :type file_path_or_obj: str or os.PathLike or h5py.File
         :param create: ill allow creation of file if it does not exist.
         :type create: bool
+        :param kwargs: Additional keyword arguments passed to h5py.File when opening a file path, e.g. the chunk cache
+            settings rdcc_nbytes, rdcc_nslots and rdcc_w0.
+        :type kwargs: dict
         '''
         if isinstance(file_path_or_obj, h5py.File):
             hdf_exists = True
@@ -77,6 +77,7 @@ class hdf_file(object):    # rare case of lower case?!
                 raise ValueError("hdf_file requires mode 'r+'.")
             self.file_path = os.path.abspath(self.hdf.filename)
         else:
+            file_path_or_obj = os.fspath(file_path_or_obj)
             hdf_exists = os.path.isfile(file_path_or_obj)
             if not create and not hdf_exists:
                 raise IOError('File not found: %s' % file_path_or_obj)
@@ -88,7 +89,7 @@ class hdf_file(object):    # rare case of lower case?!
                 self.compressor = CompressedFile(self.file_path)
                 mode = 'a'
             uncompressed_path = self.compressor.load()
-            self.hdf = h5py.File(uncompressed_path, mode=mode)
+            self.hdf = h5py.File(uncompressed_path, mode=mode, **kwargs)
 
         self.hdfaccess_version = self.hdf.attrs.get('hdfaccess_version', 1)
         if hdf_exists:
@@ -186,11 +187,6 @@ class hdf_file(object):    # rare case of lower case?!
                         self._cache[key].add(name)
         return list(self._cache[key])
 
-    if six.PY2:
-        iteritems = items
-        iterkeys = keys
-        itervalues = values
-
     # TODO: These are deprecated and should be removed!
     get_param_list = lambda self: self.keys()
     valid_param_names = lambda self: self.keys(valid_only=True)
@@ -343,7 +339,7 @@ class hdf_file(object):    # rare case of lower case?!
         #      When we implement the next version of this, we could keep a flag
         #      to determine when something has changed and then properly update
         #      the attribute prior to the file being closed.
-        return sorted({float(x.attrs['frequency']) for x in six.itervalues(self.hdf['series'])})
+        return sorted({float(x.attrs['frequency']) for x in self.hdf['series'].values()})
 
     @frequencies.setter
     def frequencies(self, frequencies):
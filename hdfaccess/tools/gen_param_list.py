@@ -7,18 +7,24 @@ from __future__ import print_function
 
 import os
 import glob
+import io
 
-FILES = glob.glob(os.path.join('list_data', 'parameters-*.txt'))
+FILES = sorted(glob.glob(os.path.join('list_data', 'parameters-*.txt')))
 
 GEN_FILENAME = 'parameter_lists.py'
 
+# Upper cases and replaces '-' with '_' in a single pass.
+VARIABLE_TRANSLATION = str.maketrans('abcdefghijklmnopqrstuvwxyz-',
+                                     'ABCDEFGHIJKLMNOPQRSTUVWXYZ_')
+
 
 def variable_from_filename(filename):
     '''
     Make a varible name from the filename string.
     '''
-    return os.path.splitext(
-        filename)[0].split(os.sep)[-1].upper().replace('-', '_')
+    name = os.path.basename(filename)
+    stem, dot, _ = name.rpartition('.')
+    return (stem if dot and stem else name).translate(VARIABLE_TRANSLATION)
 
 
 def generate_parameter_list():
@@ -26,24 +32,29 @@ def generate_parameter_list():
     Generate a python file and format the information read from the parameter
     text files into the python lists.
     '''
-    newpy = open(GEN_FILENAME, 'w')
-
-    newpy.write("'''\n%s is auto generated by %s and is compiled from:\n    %s"
-                "\n'''\n\n" % (GEN_FILENAME, __file__.split(os.sep)[-1],
-                               "\n    ".join(FILES)))
-    for txtfile in FILES:
-        varname = variable_from_filename(txtfile)
-        newpy.write('# Parameters from %s\n' % txtfile)
-        newpy.write('%s = [\n' % varname)
-        with open(txtfile, 'r') as fhdl:
-            newpy.writelines("    '%s',\n" % l.strip() for l in fhdl)
-        newpy.write(']\n\n')
+    all_parameters = set()
+    # Build the module in memory and write it out in one go.
+    with io.StringIO() as newpy:
+        newpy.write("'''\n%s is auto generated by %s and is compiled from:"
+                    "\n    %s\n'''\n\n" % (GEN_FILENAME,
+                                           os.path.basename(__file__),
+                                           "\n    ".join(FILES)))
+        for txtfile in FILES:
+            varname = variable_from_filename(txtfile)
+            with open(txtfile, 'r') as fhdl:
+                parameters = [l.strip() for l in fhdl.read().splitlines()]
+            all_parameters.update(parameters)
+            newpy.write("# Parameters from %s\n%s = [\n%s]\n\n" % (
+                txtfile, varname,
+                ''.join("    '%s',\n" % p for p in parameters)))
 
-    liststr = ' +\n    '.join(variable_from_filename(f) for f in FILES)
-    newpy.write('# List of all parameters from all files with duplicates '
-                'removed.\n')
-    newpy.write("PARAMETERS_FROM_FILES = list(set(\n    %s\n))\n" % liststr)
-    newpy.close()
+        # Remove the duplicates here rather than when the generated module is
+        # imported.
+        newpy.write("# List of all parameters from all files with duplicates "
+                    "removed.\nPARAMETERS_FROM_FILES = [\n%s]\n" % ''.join(
+                        "    '%s',\n" % p for p in sorted(all_parameters)))
+        with open(GEN_FILENAME, 'w') as pyfile:
+            pyfile.write(newpy.getvalue())
 
 
 def main():
@@ -6,27 +6,30 @@ compatible structure meeting POLARIS pre-analysis specification.
 from __future__ import print_function
 
 import argparse
-import h5py
 import json
 import logging
-import numpy as np
+import multiprocessing
 import os
 
+from collections import namedtuple
+from functools import lru_cache
 from math import ceil
 
-from flightdatautilities.patterns import wildcard_match, WILDCARD
-from flightdatautilities import units as ut
-from flightdatautilities.state_mappings import PARAMETER_CORRECTIONS
-
-from analysis_engine.utils import list_parameters
-
-from hdfaccess.file import hdf_file
-from hdfaccess.parameter import MappedArray
-from hdfaccess.tools.parameter_lists import PARAMETERS_FROM_FILES
+# h5py, numpy, flightdatautilities, analysis_engine and hdfaccess are imported
+# within the functions which use them, keeping the import of this module (and
+# the command line's startup) cheap.
 
 
 LOGGER = logging.getLogger(__name__)
 
+# The validator reads the attributes and data of every parameter, so use a
+# larger raw data chunk cache than h5py's default of 1MB.
+H5PY_CACHE_KWARGS = {
+    'rdcc_nbytes': 64 * 1024 * 1024,
+    'rdcc_nslots': 521,
+    'rdcc_w0': 0.75,
+}
+
 
 class StoppedOnFirstError(Exception):
     """ Exception class used if user wants to stop upon the first error."""
@@ -42,21 +45,45 @@ class HDFValidatorHandler(logging.Handler):
         self.stop_on_error = stop_on_error
         self.errors = 0
         self.warnings = 0
+        self._warn = logging.WARN
+        self._error = logging.ERROR
 
     def emit(self, record):
         ''' Log message. Then increment counter if message is a warning or
             error. Error count includes critical errors. '''
-        if record.levelno >= logging.ERROR:
+        levelno = record.levelno
+        # Most records are informational, so check for them first.
+        if levelno < self._warn:
+            return
+        if levelno >= self._error:
             self.errors += 1
-        elif record.levelno == logging.WARN:
+            if self.stop_on_error:
+                raise StoppedOnFirstError()
+        else:
             self.warnings += 1
-        if self.stop_on_error and record.levelno >= logging.ERROR:
-            raise StoppedOnFirstError()
 
     def get_error_counts(self):
         ''' returns the number of warnings and errors logged.'''
         return {'warnings': self.warnings, 'errors': self.errors}
 
+
+class LogRecordCollector(logging.Handler):
+    """
+    A handler to collect log records within a worker process so they can be
+    passed back and handled by the main process.
+    """
+    def __init__(self):
+        super(LogRecordCollector, self).__init__()
+        self.records = []
+
+    def emit(self, record):
+        ''' Merge the arguments into the message so the record can be
+            pickled, then store it. '''
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        self.records.append(record)
+
 VALID_FREQUENCIES = {
     # base 2 frequencies
     0.03125,
@@ -80,13 +107,41 @@ VALID_FREQUENCIES = {
     20,
 }
 
+# Attributes required on the root of the file.
+ROOT_ATTRIBUTES = frozenset({
+    'duration',
+    'reliable_frame_counter',
+    'reliable_subframe_counter',
+})
+
+# Attributes required on every parameter group.
+PARAMETER_ATTRIBUTES = frozenset({
+    'data_type',
+    'frequency',
+    'lfl',
+    'name',
+    'supf_offset',
+    'units',
+})
+
+# Data types of parameters which do not have units and require a
+# values_mapping.
+DISCRETE_DATA_TYPES = frozenset({
+    'Discrete',
+    'Enumerated Discrete',
+    'Multi-state',
+})
+
+# Root attribute values used when validating every parameter. See
+# validation_context.
+ValidationContext = namedtuple('ValidationContext', (
+    'duration', 'frequencies', 'superframe_present', 'boundary',
+    'aligned_duration'))
+
 # -----------------------------------------------------------------------------
 # Collection of parameters known to Polaris
 # -----------------------------------------------------------------------------
 
-# Main list of parameters that from the Polaris analysis engine
-PARAMETERS_ANALYSIS = list_parameters()
-
 # Minimum list of parameters (including alternatives) needed in the HDF file.
 # See check_for_core_parameters method
 PARAMETERS_CORE = [
@@ -113,22 +168,56 @@ PARAMETERS_EXTRA = [
     u'Subframe Counter',
 ]
 
-PARAMETER_LIST = list(set(PARAMETERS_FROM_FILES + PARAMETERS_ANALYSIS +
-                          PARAMETERS_CORE + PARAMETERS_EXTRA))
+
+@lru_cache(maxsize=None)
+def analysis_parameters():
+    """Returns the names of the parameters listed by the analysis engine."""
+    from analysis_engine.utils import list_parameters
+    return list_parameters()
+
+
+@lru_cache(maxsize=None)
+def parameter_list():
+    """
+    Returns the names of all parameters known to POLARIS. Built on first use,
+    as listing the parameters of the analysis engine is slow.
+    """
+    from hdfaccess.tools.parameter_lists import PARAMETERS_FROM_FILES
+    return list(set(PARAMETERS_FROM_FILES + analysis_parameters() +
+                    PARAMETERS_CORE + PARAMETERS_EXTRA))
+
+
+def __getattr__(name):
+    """
+    The PARAMETERS_ANALYSIS and PARAMETER_LIST module constants are built on
+    first access. See analysis_parameters and parameter_list.
+    """
+    if name == 'PARAMETERS_ANALYSIS':
+        return analysis_parameters()
+    if name == 'PARAMETER_LIST':
+        return parameter_list()
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
 # -----------------------------------------------------------------------------
 
 
-def log_title(title, line='=', section=True):
-    """Add visual breaks in the logging for main sections."""
+def log_title(title, *args, line='=', section=True):
+    """
+    Add visual breaks in the logging for main sections. The title is only
+    formatted with args if INFO messages are being logged.
+    """
+    if not LOGGER.isEnabledFor(logging.INFO):
+        return
+    if args:
+        title = title % args
     if section:
         LOGGER.info("%s", '_' * 80)
-    LOGGER.info(title)
+    LOGGER.info("%s", title)
     LOGGER.info("%s", line * len(title))
 
 
-def log_subtitle(subtitle):
+def log_subtitle(subtitle, *args):
     """Add visual breaks in the logging for sub sections."""
-    log_title(subtitle, line='-', section=False)
+    log_title(subtitle, *args, line='-', section=False)
 
 
 def check_parameter_names(hdf):
@@ -140,17 +229,19 @@ def check_parameter_names(hdf):
       The second, a tuple of names that do not match POLARIS parameters and
       will be ignored by analysis.
     """
+    from flightdatautilities.patterns import wildcard_match, WILDCARD
+
     log_subtitle("Checking parameter names")
     hdf_parameters = set(hdf.keys())
 
     matched_names = set()
-    for name in PARAMETER_LIST:
+    for name in parameter_list():
         if WILDCARD in name:
             found = wildcard_match(name, hdf_parameters, missing=False)
-        else:
-            found = [name for p in hdf_parameters if p == name]
-        if found:
-            matched_names.update(found)
+            if found:
+                matched_names.update(found)
+        elif name in hdf_parameters:
+            matched_names.add(name)
 
     unmatched_names = hdf_parameters - matched_names
     if not matched_names:
@@ -182,7 +273,7 @@ def check_for_core_parameters(hdf, helicopter=False):
     - either 'Nr' or for dual rotors 'Nr (1)' and 'Nr (2)'
     Minimum parameter required for any analysis to be performed.
     """
-    hdf_parameters = hdf.keys()
+    hdf_parameters = frozenset(hdf.keys())
     airspeed = 'Airspeed' in hdf_parameters
     altitude = 'Altitude STD' in hdf_parameters
     heading = 'Heading' in hdf_parameters
@@ -219,48 +310,177 @@ def check_for_core_parameters(hdf, helicopter=False):
 # =============================================================================
 #   Parameter's Attributes
 # =============================================================================
-def validate_parameters(hdf, helicopter=False, names=None, states=False):
+def validate_parameters(hdf, helicopter=False, names=None, states=False,
+                        jobs=1):
     """
     Iterates through all the parameters within the 'series' namespace and
     validates:
         Matches a POLARIS recognised parameter
         Attributes
         Data
+    If jobs is greater than 1, the parameters are validated by a pool of
+    worker processes, each opening the file once.
     """
     log_title("Checking Parameters")
     matched, _ = check_parameter_names(hdf)
+    matched = frozenset(matched)
     check_for_core_parameters(hdf, helicopter)
-    for name in hdf.keys():
-        if names and name not in names:
-            continue
-        try:
-            parameter = hdf.get_param(name)
-        except np.ma.core.MaskError as err:
-            LOGGER.error("MaskError: Cannot get parameter '%s' (%s).",
-                         name, err)
-            continue
-        log_title("Checking Parameter: '%s'" % (name, ))
-        if name in matched:
-            LOGGER.info("Parameter '%s' is recognised by POLARIS.", name)
-        else:
-            LOGGER.warn("Parameter '%s' is not recognised by POLARIS.", name)
-        if name in PARAMETERS_CORE:
-            LOGGER.info("Parameter '%s' is a core parameter required for "
-                        "analysis.", name)
-        validate_parameter_attributes(hdf, name, parameter, name in matched, states=states)
-        validate_parameters_dataset(hdf, name, parameter)
+    names = frozenset(names) if names else None
+    hdf_parameters = [name for name in hdf.keys()
+                      if names is None or name in names]
+    metadata = collect_series_metadata(hdf.hdf, names=hdf_parameters)
+    context = validation_context(hdf)
+    if jobs > 1 and len(hdf_parameters) > 1:
+        validate_parameters_parallel(hdf.file_path, hdf_parameters, matched,
+                                     metadata, context, states=states,
+                                     jobs=jobs)
+        return
+    for name in hdf_parameters:
+        validate_parameter(hdf, name, name in matched,
+                           param_attrs=metadata.get(name), context=context,
+                           states=states)
     return
 
 
-def validate_parameter_attributes(hdf, name, parameter, matched, states=False):
+def validate_parameter(hdf, name, matched, param_attrs=None, context=None,
+                       states=False):
+    """Validates a single parameter's attributes and data."""
+    import numpy as np
+
+    try:
+        parameter = hdf.get_param(name)
+    except np.ma.core.MaskError as err:
+        LOGGER.error("MaskError: Cannot get parameter '%s' (%s).",
+                     name, err)
+        return
+    log_title("Checking Parameter: '%s'", name)
+    if matched:
+        LOGGER.info("Parameter '%s' is recognised by POLARIS.", name)
+    else:
+        LOGGER.warn("Parameter '%s' is not recognised by POLARIS.", name)
+    if name in PARAMETERS_CORE:
+        LOGGER.info("Parameter '%s' is a core parameter required for "
+                    "analysis.", name)
+    validate_parameter_attributes(hdf, name, parameter, matched,
+                                  states=states, param_attrs=param_attrs,
+                                  context=context)
+    validate_parameters_dataset(hdf, name, parameter, context=context)
+
+
+def validate_parameters_parallel(file_path, hdf_parameters, matched, metadata,
+                                 context, states=False, jobs=2):
+    """
+    Validate parameters across a pool of processes. HDF5 serialises access
+    from threads within a process, so each worker opens its own read-only
+    handle once (decompressing '.gz' files once per worker rather than once
+    per task) and validates contiguous slices of the parameters. The log
+    records from each slice, including those of other loggers such as the
+    root logger, are handled by this process in order, so the output matches
+    a sequential run.
+    """
+    chunk_size = -(-len(hdf_parameters) // (jobs * 4))
+    tasks = []
+    for index in range(0, len(hdf_parameters), chunk_size):
+        chunk = hdf_parameters[index:index + chunk_size]
+        tasks.append((
+            chunk,
+            frozenset(name for name in chunk if name in matched),
+            {name: metadata.get(name) for name in chunk},
+            context,
+            states,
+        ))
+    # spawn rather than fork, as the HDF5 library state of this process
+    # (which has the file open) must not be shared with the workers.
+    context = multiprocessing.get_context('spawn')
+    pool = context.Pool(min(jobs, len(tasks)),
+                        initializer=_init_parameters_worker,
+                        initargs=(file_path, LOGGER.name,
+                                  LOGGER.getEffectiveLevel(),
+                                  logging.getLogger().level))
+    try:
+        for records in pool.imap(_validate_parameters_worker, tasks):
+            for record in records:
+                logging.getLogger(record.name).handle(record)
+        # Let the workers exit normally so their files are closed.
+        pool.close()
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+
+# The hdf_file and log record collector of a worker process. See
+# _init_parameters_worker.
+_WORKER_HDF = None
+_WORKER_COLLECTOR = None
+
+
+def _init_parameters_worker(file_path, logger_name, level, root_level):
+    """
+    Open the file and redirect logging to a collector once per worker
+    process. The collector is attached to the root logger so that it also
+    collects the records of other loggers, e.g. those of hdfaccess.file,
+    which a sequential run would emit. The file is closed as the worker
+    exits.
+    """
+    from multiprocessing.util import Finalize
+    from hdfaccess.file import hdf_file
+
+    global LOGGER, _WORKER_HDF, _WORKER_COLLECTOR
+    # Log with the name of the main process's logger, which differs when the
+    # validator is run as a script.
+    LOGGER = logging.getLogger(logger_name)
+    _WORKER_COLLECTOR = LogRecordCollector()
+    root = logging.getLogger()
+    root.handlers = [_WORKER_COLLECTOR]
+    root.setLevel(root_level)
+    LOGGER.handlers = []
+    LOGGER.propagate = True
+    LOGGER.setLevel(level)
+    _WORKER_HDF = hdf_file(file_path, read_only=True, **H5PY_CACHE_KWARGS)
+    Finalize(_WORKER_HDF, _WORKER_HDF.close, exitpriority=10)
+
+
+def _validate_parameters_worker(task):
+    """Validate a slice of parameters within a worker process."""
+    names, matched, metadata, context, states = task
+    _WORKER_COLLECTOR.records = []
+    for name in names:
+        validate_parameter(_WORKER_HDF, name, name in matched,
+                           param_attrs=metadata.get(name),
+                           context=context, states=states)
+    return _WORKER_COLLECTOR.records
+
+
+def collect_series_metadata(hdf5, names):
+    """
+    List the attribute names of the given parameters' groups within the
+    'series' namespace up front, rather than looking up each group by name
+    while validating. Only the names are read; attribute values are read by
+    get_param.
+    Returns a dictionary of parameter name to a frozenset of attribute names.
+    """
+    import h5py
+
+    series = hdf5['series']
+    metadata = {}
+    for name in names:
+        group = series.get(name)
+        if isinstance(group, h5py.Group):
+            metadata[name] = frozenset(group.attrs)
+    return metadata
+
+
+def validate_parameter_attributes(hdf, name, parameter, matched, states=False,
+                                  param_attrs=None, context=None):
     """Validates all parameter attributes."""
-    log_subtitle("Checking Attribute for Parameter: %s" % (name, ))
-    param_attrs = hdf.hdf['/series/' + name].attrs.keys()
-    for attr in ['data_type', 'frequency', 'lfl', 'name',
-                 'supf_offset', 'units']:
-        if attr not in param_attrs:
-            LOGGER.error("Parameter attribute '%s' not present for '%s' "
-                         "and is Required.", attr, name)
+    log_subtitle("Checking Attribute for Parameter: %s", name)
+    if param_attrs is None:
+        param_attrs = frozenset(hdf.hdf['/series/' + name].attrs)
+    for attr in sorted(PARAMETER_ATTRIBUTES.difference(param_attrs)):
+        LOGGER.error("Parameter attribute '%s' not present for '%s' and is "
+                     "Required.", attr, name)
     validate_arinc_429(parameter)
     validate_source_name(parameter, matched)
     validate_supf_offset(parameter)
@@ -268,7 +488,7 @@ def validate_parameter_attributes(hdf, name, parameter, matched, states=False):
     if 'data_type' in param_attrs:
         validate_data_type(parameter)
     if 'frequency' in param_attrs:
-        validate_frequency(hdf, parameter)
+        validate_frequency(hdf, parameter, context=context)
     if 'lfl' in param_attrs:
         validate_lfl(parameter)
     if 'name' in param_attrs:
@@ -277,10 +497,70 @@ def validate_parameter_attributes(hdf, name, parameter, matched, states=False):
         validate_units(parameter)
 
 
-def validate_parameters_dataset(hdf, name, parameter):
+def validate_parameters_dataset(hdf, name, parameter, context=None):
     """Validates all parameter datasets."""
-    log_subtitle("Checking dataset for Parameter: %s" % (name, ))
-    validate_dataset(hdf, name, parameter)
+    log_subtitle("Checking dataset for Parameter: %s", name)
+    validate_dataset(hdf, name, parameter, context=context)
+    validate_chunk_layout(hdf, name)
+
+
+def chunk_layout(dataset):
+    """
+    Returns the number of allocated chunks and their total stored size in
+    bytes for a chunked dataset, or None if the installed h5py/HDF5 cannot
+    query chunk information.
+    Uses a single H5Dchunk_iter walk where available (h5py >= 3.8 with
+    HDF5 >= 1.12.3) rather than looking up each chunk by index.
+    """
+    counts = [0, 0]
+
+    def _visit(info):
+        counts[0] += 1
+        counts[1] += info.size
+
+    dsid = dataset.id
+    if hasattr(dsid, 'chunk_iter'):
+        dsid.chunk_iter(_visit)
+    elif hasattr(dsid, 'get_num_chunks'):
+        for index in range(dsid.get_num_chunks()):
+            _visit(dsid.get_chunk_info(index))
+    else:
+        return None
+    return tuple(counts)
+
+
+def validate_chunk_layout(hdf, name):
+    """
+    Check the chunked storage of the parameter's data and mask datasets.
+    Reports chunks which have not been allocated, their values are read as
+    the dataset's fill value rather than stored data.
+    """
+    LOGGER.info("Checking dataset chunk layout.")
+    group = hdf.hdf['series'][name]
+    for dataset_name in ('data', 'mask'):
+        if dataset_name not in group:
+            continue
+        dataset = group[dataset_name]
+        if dataset.chunks is None:
+            LOGGER.info("'%s' dataset is stored contiguously.", dataset_name)
+            continue
+        layout = chunk_layout(dataset)
+        if layout is None:
+            LOGGER.debug("Chunk information is not available with this "
+                         "version of h5py/HDF5.")
+            return
+        allocated, stored_size = layout
+        expected = 1
+        for length, chunk in zip(dataset.shape, dataset.chunks):
+            expected *= -(-length // chunk)
+        if allocated < expected:
+            LOGGER.warning("'%s' dataset has %s of %s chunks allocated. "
+                           "Unallocated chunks will be read as the fill "
+                           "value.", dataset_name, allocated, expected)
+        else:
+            LOGGER.info("'%s' dataset is stored in %s chunks of %s "
+                        "using %s bytes.", dataset_name, allocated,
+                        dataset.chunks, stored_size)
 
 
 # =============================================================================
@@ -346,7 +626,7 @@ def validate_data_type(parameter):
                     parameter.array.dtype.name)
 
 
-def validate_frequency(hdf, parameter):
+def validate_frequency(hdf, parameter, context=None):
     """
     Checks the parameter attribute frequency exists (It is required)
     and report if it is a valid frequency and if it is listed in the root
@@ -365,12 +645,13 @@ def validate_frequency(hdf, parameter):
             LOGGER.info("'frequency': Value is %s Hz for '%s' and is a "
                         "support frequency.", parameter.frequency,
                         parameter.name)
-        if hdf.frequencies is not None:
-            if 'array' in type(hdf.frequencies).__name__:
-                if parameter.frequency not in hdf.frequencies:
+        frequencies = context.frequencies if context else hdf.frequencies
+        if frequencies is not None:
+            if 'array' in type(frequencies).__name__:
+                if parameter.frequency not in frequencies:
                     LOGGER.warn("'frequency': Value not in the Root "
                                 "attribute list of frequenices.")
-            elif parameter.frequency != hdf.frequencies:
+            elif parameter.frequency != frequencies:
                 LOGGER.warn("'frequency': Value not in the Root "
                             "attribute list of frequenices.")
 
@@ -442,13 +723,9 @@ def validate_supf_offset(parameter):
                      "Required. ", parameter.name)
     else:
         if 'float' not in type(parameter.offset).__name__:
-            msg = "'supf_offset': Type for '%s' is not a float. "\
-                "Got %s instead" % (parameter.name,
-                                    type(parameter.offset).__name__)
-            if parameter.offset == 0:
-                LOGGER.warn(msg)
-            else:
-                LOGGER.error(msg)
+            log = LOGGER.warn if parameter.offset == 0 else LOGGER.error
+            log("'supf_offset': Type for '%s' is not a float. Got %s instead",
+                parameter.name, type(parameter.offset).__name__)
         else:
             LOGGER.info("'supf_offset': Attribute is present and correct "
                         "data type and has a value of %s", parameter.offset)
@@ -459,9 +736,10 @@ def validate_units(parameter):
     Check if the parameter attribute units exists (It is required)
     and reports the value and if it is valid unit name.
     """
+    from flightdatautilities import units as ut
+
     LOGGER.info("Checking parameter attribute: units")
-    if parameter.data_type in ('Discrete', 'Multi-state',
-                               'Enumerated Discrete'):
+    if parameter.data_type in DISCRETE_DATA_TYPES:
         return
     if parameter.units is None:
         LOGGER.warn("'units': No attribute for '%s'. Attribute is Required.",
@@ -505,8 +783,7 @@ def validate_values_mapping(hdf, parameter, states=False):
     """
     LOGGER.info("Checking parameter attribute: values_mapping")
     if parameter.values_mapping is None:
-        if parameter.data_type in ('Discrete', 'Multi-state',
-                                   'Enumerated Discrete'):
+        if parameter.data_type in DISCRETE_DATA_TYPES:
             LOGGER.error("'values_mapping': No attribute for '%s'. "
                          "Attribute is Required for a %s parameter.",
                          parameter.name, parameter.data_type)
@@ -556,6 +833,9 @@ def validate_values_mapping(hdf, parameter, states=False):
 
     LOGGER.info("Checking parameter states and checking the validity: states")
     if states:
+        from flightdatautilities.patterns import wildcard_match
+        from flightdatautilities.state_mappings import PARAMETER_CORRECTIONS
+
         if not '(' in parameter.name or not ')' in parameter.name:
             states = PARAMETER_CORRECTIONS.get(parameter.name)
             if states and {k: v for k, v in parameter.values_mapping.items() if v != '-'} != states:
@@ -577,11 +857,14 @@ def validate_values_mapping(hdf, parameter, states=False):
                     break
 
 
-def validate_dataset(hdf, name, parameter):
+def validate_dataset(hdf, name, parameter, context=None):
     """Check the data for size, unmasked inf/NaN values."""
+    import numpy as np
+    from hdfaccess.parameter import MappedArray
+
     inf_nan_check(parameter)
 
-    expected_size_check(hdf, parameter)
+    expected_size_check(hdf, parameter, context=context)
     if parameter.array.data.size != parameter.array.mask.size:
         LOGGER.error("The data and mask sizes are different. (Data is %s, "
                      "Mask is %s)", parameter.array.data.size,
@@ -609,38 +892,54 @@ def validate_dataset(hdf, name, parameter):
         LOGGER.warning("Data for '%s' is entirely masked. Is it meant to be?",
                        name)
 
-def expected_size_check(hdf, parameter):
-    boundary = 64.0 if hdf.superframe_present else 4.0
-    frame = 'super frame' if hdf.superframe_present else 'frame'
+def validation_context(hdf):
+    """
+    Returns a ValidationContext of the root attributes used when validating
+    each parameter, read once rather than for every parameter. Includes the
+    frame boundary size and the duration of the file padded to the next
+    frame/super frame boundary (None if the duration is unknown).
+    """
+    duration = hdf.duration
+    superframe_present = bool(hdf.superframe_present)
+    boundary = 64.0 if superframe_present else 4.0
+    aligned_duration = ceil(duration / boundary) * boundary if duration \
+        else None
+    return ValidationContext(duration, hdf.frequencies, superframe_present,
+                             boundary, aligned_duration)
+
+
+def expected_size_check(hdf, parameter, context=None):
+    if context is None:
+        context = validation_context(hdf)
+    boundary = context.boundary
+    aligned_duration = context.aligned_duration
+    frame = 'super frame' if context.superframe_present else 'frame'
     LOGGER.info('Boundary size is %s for a %s.', boundary, frame)
     # Expected size of the data is duration * the parameter's frequency,
     # includes any padding required to the next frame/super frame boundary
-    if hdf.duration and parameter.frequency:
-        expected_data_size = \
-            ceil(hdf.duration / boundary) * boundary * parameter.frequency
+    if aligned_duration and parameter.frequency:
+        expected_data_size = aligned_duration * parameter.frequency
     else:
         LOGGER.error("%s: Not enough information to calculate expected data "
                      "size. Duration: %s, Parameter Frequency: %s",
-                     parameter.name,
-                     'None' if hdf.duration is None else hdf.duration,
-                     'None' if parameter.frequency is None else
-                     parameter.frequency)
+                     parameter.name, context.duration, parameter.frequency)
         return
 
     LOGGER.info("Checking parameters dataset size against expected frame "
                 "aligned size of %s.", int(expected_data_size))
-    LOGGER.debug("Calculated: ceil(Duration(%s) / Boundary(%s)) * "
-                 "Boundary(%s) * Parameter Frequency (%s) = %s.",
-                 hdf.duration, boundary, boundary, parameter.frequency,
+    LOGGER.debug("Calculated: ceil(Duration / Boundary(%s)) * "
+                 "Boundary(%s) = %s, * Parameter Frequency (%s) = %s.",
+                 boundary, boundary, aligned_duration, parameter.frequency,
                  expected_data_size)
 
-    if expected_data_size != parameter.array.size:
+    size = parameter.array.size
+    if expected_data_size != size:
         LOGGER.error("The data size of '%s' is %s and different to the "
                      "expected frame aligned size of %s. The data needs "
                      "padding by %s extra masked elements to align to the "
                      "next frame boundary.", parameter.name,
-                     parameter.array.size, int(expected_data_size),
-                     int(expected_data_size)-parameter.array.size)
+                     size, int(expected_data_size),
+                     int(expected_data_size) - size)
     else:
         LOGGER.info("Data size of '%s' is of the expected size of %s.",
                     parameter.name, int(expected_data_size))
@@ -650,34 +949,38 @@ def inf_nan_check(parameter):
     '''
     Check the dataset for NaN or inf values
     '''
+    import numpy as np
+
     def _report(count, parameter, unmasked, val_str):
         '''
         log as warning if all are masked, error if not
         '''
         if count:
-            msg = "Found %s %s values in the data of '%s'. " \
-                % (count, val_str, parameter.name)
             nan_percent = (float(count) / len(parameter.array.data)) * 100
-            msg += "This represents %.2f%% of the data. " % (nan_percent, )
             if unmasked:
-                msg += "%s are not masked." % (unmasked,)
-                LOGGER.error(msg)
+                LOGGER.error("Found %s %s values in the data of '%s'. This "
+                             "represents %.2f%% of the data. %s are not "
+                             "masked.", count, val_str, parameter.name,
+                             nan_percent, unmasked)
             else:
-                msg += "All of these values are masked."
-                LOGGER.warn(msg)
+                LOGGER.warn("Found %s %s values in the data of '%s'. This "
+                            "represents %.2f%% of the data. All of these "
+                            "values are masked.", count, val_str,
+                            parameter.name, nan_percent)
 
     LOGGER.info("Checking parameter dataset for inf and NaN values.")
     if 'int' in parameter.array.dtype.name or \
        'float' in parameter.array.dtype.name:
 
-        nan_unmasked = np.ma.masked_equal(
-            np.isnan(parameter.array), False).count()
-        nan_count = np.ma.masked_equal(
-            np.isnan(parameter.array.data), False).count()
-        inf_unmasked = np.ma.masked_equal(
-            np.isinf(parameter.array), False).count()
-        inf_count = np.ma.masked_equal(
-            np.isinf(parameter.array.data), False).count()
+        # Work on the plain data and mask so each check is a single pass.
+        data = np.ma.getdata(parameter.array)
+        unmasked = ~np.ma.getmaskarray(parameter.array)
+        nan = np.isnan(data)
+        nan_count = np.count_nonzero(nan)
+        nan_unmasked = np.count_nonzero(nan & unmasked) if nan_count else 0
+        inf = np.isinf(data)
+        inf_count = np.count_nonzero(inf)
+        inf_unmasked = np.count_nonzero(inf & unmasked) if inf_count else 0
 
         _report(nan_count, parameter, nan_unmasked, 'NaN')
         _report(inf_count, parameter, inf_unmasked, 'inf')
@@ -690,11 +993,14 @@ def validate_namespace(hdf5):
     '''Uses h5py functions to verify what is stored on the root group.'''
     found = ''
     log_title("Checking for the namespace 'series' group on root")
-    if 'series' in hdf5.keys():
+    # Enumerate the root links once; the existence check itself is a single
+    # link lookup.
+    root_keys = list(hdf5)
+    if 'series' in hdf5:
         LOGGER.info("Found the POLARIS namespace 'series' on root.")
         found = 'series'
     else:
-        found = [g for g in hdf5.keys() if 'series' in g.lower()]
+        found = [g for g in root_keys if 'series' in g.lower()]
         if found:
             # series found but in the wrong case.
             LOGGER.error("Namespace '%s' found, but needs to be in "
@@ -703,16 +1009,16 @@ def validate_namespace(hdf5):
             LOGGER.error("Namespace 'series' was not found on root.")
 
     LOGGER.info("Checking for other namespace groups on root.")
-    group_num = len(hdf5.keys())
+    group_num = len(root_keys)
 
     show_groups = False
-    if group_num is 1 and 'series' in found:
+    if group_num == 1 and 'series' in found:
         LOGGER.info("Namespace 'series' is the only group on root.")
-    elif group_num is 1 and 'series' not in found:
+    elif group_num == 1 and 'series' not in found:
         LOGGER.error("Only one namespace on root,but not the required "
                      "'series' namespace.")
         show_groups = True
-    elif group_num is 0:
+    elif group_num == 0:
         LOGGER.error("No namespace groups found in the file.")
     elif group_num > 1 and 'series' in found:
         LOGGER.warn("Namespace 'series' found, along with %s addtional "
@@ -726,9 +1032,9 @@ def validate_namespace(hdf5):
                      "parmeters and required by Polaris for analysis, they "
                      "must be stored within 'series'.", group_num)
         show_groups = True
-    if show_groups:
+    if show_groups and LOGGER.isEnabledFor(logging.DEBUG):
         LOGGER.debug("The following namespace groups are on root: %s",
-                     [g for g in hdf5.keys() if 'series' not in g])
+                     [g for g in root_keys if 'series' not in g])
 
 
 
@@ -738,38 +1044,40 @@ def validate_namespace(hdf5):
 def validate_root_attribute(hdf):
     """Validates all the root attributes."""
     log_title("Checking the Root attributes")
-    root_attrs = hdf.hdf.attrs.keys()
-    for attr in ['duration', 'reliable_frame_counter',
-                 'reliable_subframe_counter',]:
-        if attr not in root_attrs:
-            LOGGER.error("Root attribute '%s' not present and is required.",
-                         attr)
+    root_attrs = dict(hdf.hdf.attrs)
+    hdf_keys = set(hdf.keys())
+    for attr in sorted(ROOT_ATTRIBUTES.difference(root_attrs)):
+        LOGGER.error("Root attribute '%s' not present and is required.", attr)
     if 'duration' in root_attrs:
-        validate_duration_attribute(hdf)
+        validate_duration_attribute(hdf, root_attrs)
     validate_frequencies_attribute(hdf)
     if 'reliable_frame_counter' in root_attrs:
-        validate_reliable_frame_counter_attribute(hdf)
+        validate_reliable_frame_counter_attribute(hdf, hdf_keys)
     if 'reliable_subframe_counter' in root_attrs:
-        validate_reliable_subframe_counter_attribute(hdf)
-    validate_start_timestamp_attribute(hdf)
+        validate_reliable_subframe_counter_attribute(hdf, hdf_keys)
+    validate_start_timestamp_attribute(hdf, root_attrs)
     validate_superframe_present_attribute(hdf)
 
 
-def validate_duration_attribute(hdf):
+def validate_duration_attribute(hdf, root_attrs=None):
     """
     Check if the root attribute duration exists (It is required)
     and report the value.
     """
+    import numpy as np
+
     LOGGER.info("Checking Root Attribute: duration")
-    if hdf.duration:
+    if root_attrs is None:
+        root_attrs = dict(hdf.hdf.attrs)
+    duration = root_attrs.get('duration')
+    if duration:
         LOGGER.info("'duration': Attribute present with a value of %s.",
-                    hdf.hdf.attrs['duration'])
-        if 'int' in type(hdf.hdf.attrs['duration']).__name__:
+                    duration)
+        if isinstance(duration, (int, np.integer)):
             LOGGER.debug("'duration': Attribute is an int.")
         else:
             LOGGER.error("'duration': Attribute is not an int. Type "
-                         "reported as '%s'.",
-                         type(hdf.hdf.attrs['duration']).__name__)
+                         "reported as '%s'.", type(duration).__name__)
     else:
         LOGGER.error("'duration': No root attribrute found. This is a "
                      "required attribute.")
@@ -781,33 +1089,42 @@ def validate_frequencies_attribute(hdf):
         Report all the values and if the list covers all frequencies used
         by the store parameters.
     """
+    import numpy as np
+
     LOGGER.info("Checking Root Attribute: 'frequencies'")
-    if hdf.frequencies is None:
+    frequencies = hdf.frequencies
+    if frequencies is None:
         LOGGER.info("'frequencies': Attribute not present and is optional.")
         return
 
     LOGGER.info("'frequencies': Attribute present.")
-    name = type(hdf.frequencies).__name__
-    if 'array' in name or 'list' in name:
-        floatcount = 0
-        rootfreq = set(list(hdf.frequencies))
-        for value in hdf.frequencies:
-            if 'float' in type(value).__name__:
-                floatcount += 1
-            else:
-                LOGGER.error("'frequencies': Value %s should be a float.",
-                             value)
-        if floatcount == len(hdf.frequencies):
+    if isinstance(frequencies, (np.ndarray, list, tuple)):
+        if isinstance(frequencies, np.ndarray):
+            all_float = np.issubdtype(frequencies.dtype, np.floating)
+            rootfreq = set(frequencies.tolist())
+        else:
+            all_float = all(isinstance(value, (float, np.floating))
+                            for value in frequencies)
+            rootfreq = set(frequencies)
+        if all_float:
             LOGGER.info("'frequencies': All values listed are float values.")
         else:
+            for value in frequencies:
+                if not isinstance(value, (float, np.floating)):
+                    LOGGER.error("'frequencies': Value %s should be a float.",
+                                 value)
             LOGGER.error("'frequencies': Not all values are float values.")
-    elif 'float' in name:
+    elif isinstance(frequencies, (float, np.floating)):
         LOGGER.info("'frequencies': Value is a float.")
-        rootfreq = set([hdf.frequencies])
+        rootfreq = {frequencies}
     else:
         LOGGER.error("'frequencies': Value is not a float.")
+        return
 
-    paramsfreq = set([v.frequency for _, v in hdf.items()])
+    # Parameter frequencies are read from the group attributes to avoid
+    # loading every parameter's data.
+    paramsfreq = {float(group.attrs.get('frequency', 1))
+                  for group in hdf.hdf['series'].values()}
     if rootfreq == paramsfreq:
         LOGGER.info("Root frequency list covers all the frequencies "
                     "used by parameters.")
@@ -821,31 +1138,38 @@ def validate_frequencies_attribute(hdf):
                     list(paramsfreq - rootfreq))
 
 
-def is_reliable_frame_counter(hdf):
+def is_reliable_frame_counter(hdf, hdf_keys=None):
     """returns if the parameter 'Frame Counter' is reliable."""
+    import numpy as np
+
+    if hdf_keys is not None and 'Frame Counter' not in hdf_keys:
+        return False
     try:
         pfc = hdf['Frame Counter']
     except KeyError:
         return False
-    if np.ma.masked_inside(pfc, 0, 4095).count() != 0:
+    data = np.ma.getdata(pfc.array)
+    valid = ~np.ma.getmaskarray(pfc.array)
+    # unmasked values must all be within the counter's range
+    if (((data < 0) | (data > 4095)) & valid).any():
         return False
-    # from split_hdf_to_segments.py
-    fc_diff = np.ma.diff(pfc.array)
-    fc_diff = np.ma.masked_equal(fc_diff, 1)
-    fc_diff = np.ma.masked_equal(fc_diff, -4095)
-    if fc_diff.count() == 0:
-        return True
-    return False
+    # from split_hdf_to_segments.py, consecutive unmasked values must either
+    # increment by one or wrap around.
+    fc_diff = np.diff(data)
+    jumps = (fc_diff != 1) & (fc_diff != -4095) & valid[1:] & valid[:-1]
+    return not jumps.any()
 
 
-def validate_reliable_frame_counter_attribute(hdf):
+def validate_reliable_frame_counter_attribute(hdf, hdf_keys=None):
     """
     Check if the root attribute reliable_frame_counter exists (It is required)
     and report the value and if the value is correctly set.
     """
     LOGGER.info("Checking Root Attribute: 'reliable_frame_counter'")
-    parameter_exists = 'Frame Counter' in hdf.keys()
-    reliable = is_reliable_frame_counter(hdf)
+    if hdf_keys is None:
+        hdf_keys = set(hdf.keys())
+    parameter_exists = 'Frame Counter' in hdf_keys
+    reliable = is_reliable_frame_counter(hdf, hdf_keys)
     attribute_value = hdf.reliable_frame_counter
     correct_type = isinstance(hdf.reliable_frame_counter, bool)
     if attribute_value is None:
@@ -882,26 +1206,32 @@ def validate_reliable_frame_counter_attribute(hdf):
                          type(hdf.reliable_frame_counter).__name__)
 
 
-def is_reliable_subframe_counter(hdf):
+def is_reliable_subframe_counter(hdf, hdf_keys=None):
     """returns if the parameter 'Subframe Counter' is reliable."""
+    import numpy as np
+
+    if hdf_keys is not None and 'Subframe Counter' not in hdf_keys:
+        return False
     try:
         sfc = hdf['Subframe Counter']
     except KeyError:
         return False
-    sfc_diff = np.ma.masked_equal(np.ma.diff(sfc.array), 1)
-    if sfc_diff.count() == 0:
-        return True
-    return False
+    data = np.ma.getdata(sfc.array)
+    valid = ~np.ma.getmaskarray(sfc.array)
+    jumps = (np.diff(data) != 1) & valid[1:] & valid[:-1]
+    return not jumps.any()
 
 
-def validate_reliable_subframe_counter_attribute(hdf):
+def validate_reliable_subframe_counter_attribute(hdf, hdf_keys=None):
     """
     Check if the root attribute reliable_subframe_counter exists
     (It is required) and report the value and if the value is correctly set.
     """
     LOGGER.info("Checking Root Attribute: 'reliable_subframe_counter'")
-    parameter_exists = 'Subframe Counter' in hdf.keys()
-    reliable = is_reliable_subframe_counter(hdf)
+    if hdf_keys is None:
+        hdf_keys = set(hdf.keys())
+    parameter_exists = 'Subframe Counter' in hdf_keys
+    reliable = is_reliable_subframe_counter(hdf, hdf_keys)
     attribute_value = hdf.reliable_subframe_counter
     correct_type = isinstance(hdf.reliable_subframe_counter, bool)
     if attribute_value is None:
@@ -938,23 +1268,26 @@ def validate_reliable_subframe_counter_attribute(hdf):
                          type(hdf.reliable_subframe_counter).__name__)
 
 
-def validate_start_timestamp_attribute(hdf):
+def validate_start_timestamp_attribute(hdf, root_attrs=None):
     """
     Check if the root attribute start_timestamp exists
     and report the value.
     """
+    import numpy as np
+
     LOGGER.info("Checking Root Attribute: start_timestamp")
-    if hdf.start_datetime:
+    if root_attrs is None:
+        root_attrs = dict(hdf.hdf.attrs)
+    timestamp = root_attrs.get('start_timestamp')
+    if timestamp:
         LOGGER.info("'start_timestamp' attribute present.")
         LOGGER.info("Time reported to be, %s", hdf.start_datetime)
-        LOGGER.info("Epoch timestamp value is: %s",
-                    hdf.hdf.attrs['start_timestamp'])
-        if 'float' in type(hdf.hdf.attrs['start_timestamp']).__name__:
+        LOGGER.info("Epoch timestamp value is: %s", timestamp)
+        if isinstance(timestamp, (float, np.floating)):
             LOGGER.info("'start_timestamp': Attribute is a float.")
         else:
             LOGGER.error("'start_timestamp': Attribute is not a float. Type "
-                         "reported as '%s'.",
-                         type(hdf.hdf.attrs['start_timestamp']).__name__)
+                         "reported as '%s'.", type(timestamp).__name__)
     else:
         LOGGER.info("'start_timestamp': Attribute not present and is "
                     "optional.")
@@ -973,19 +1306,23 @@ def validate_superframe_present_attribute(hdf):
                     "is optional.")
 
 
-def validate_file(hdffile, helicopter=False, names=None, states=False):
+def validate_file(hdffile, helicopter=False, names=None, states=False,
+                  jobs=1):
     """
     Attempts to open the HDF5 file in using FlightDataAccessor and run all the
     validation tests. If the file cannot be opened, it will attempt to open
     the file using the h5py package and validate the namespace to test the
     HDF5 group structure.
     """
-    filename = hdffile.split(os.sep)[-1]
+    import h5py
+    from hdfaccess.file import hdf_file
+
+    filename = os.path.basename(hdffile)
     open_with_h5py = False
     hdf = None
     LOGGER.info("Verifying file '%s' with FlightDataAccessor.", filename)
     try:
-        hdf = hdf_file(hdffile, read_only=True)
+        hdf = hdf_file(hdffile, read_only=True, **H5PY_CACHE_KWARGS)
     except Exception as err:
         LOGGER.error("FlightDataAccessor cannot open '%s'. "
                      "Exception(%s: %s)", filename, type(err).__name__, err)
@@ -997,7 +1334,7 @@ def validate_file(hdffile, helicopter=False, names=None, states=False):
     if open_with_h5py:
         LOGGER.info("Checking that H5PY package can read the file.")
         try:
-            hdf_alt = h5py.File(hdffile, 'r')
+            hdf_alt = h5py.File(hdffile, 'r', **H5PY_CACHE_KWARGS)
         except Exception as err:
             LOGGER.error("Cannot open '%s' using H5PY. Exception(%s: %s)",
                          filename, type(err).__name__, err)
@@ -1012,7 +1349,8 @@ def validate_file(hdffile, helicopter=False, names=None, states=False):
         validate_namespace(hdf.hdf)
         # continue testing using FlightDataAccessor
         validate_root_attribute(hdf)
-        validate_parameters(hdf, helicopter, names=names, states=states)
+        validate_parameters(hdf, helicopter, names=names, states=states,
+                            jobs=jobs)
     if hdf:
         hdf.close()
 
@@ -1037,6 +1375,13 @@ def main():
     )
     parser.add_argument('--states', action='store_true',
                         help='Check parameter states are consistent')
+    parser.add_argument(
+        '-j', '--jobs',
+        metavar='N',
+        type=int,
+        default=1,
+        help='Number of processes used to validate parameters.',
+    )
     parser.add_argument(
         "-s",
         "--stop-on-error",
@@ -1108,10 +1453,14 @@ def main():
     hdfv_hdlr.setFormatter(fmtr)
     LOGGER.addHandler(hdfv_hdlr)
 
-    LOGGER.setLevel(logging.DEBUG)
-    LOGGER.debug("Arguments: %s", str(args))
+    # Only create log records that at least one handler will accept; the
+    # validator logs for every parameter so records below every handler's
+    # level are otherwise built and discarded.
+    LOGGER.setLevel(min(hdlr.level for hdlr in LOGGER.handlers))
+    LOGGER.debug("Arguments: %s", args)
     try:
-        validate_file(args.HDF5, args.helicopter, names=args.parameter, states=args.states)
+        validate_file(args.HDF5, args.helicopter, names=args.parameter,
+                      states=args.states, jobs=args.jobs)
     except StoppedOnFirstError:
         msg = "First error encountered. Stopping as requested."
         LOGGER.info(msg)
@@ -1,10 +1,941 @@
 '''
 parameter_lists.py is auto generated by gen_param_list.py and is compiled from:
+    list_data/parameters-data_exports.txt
     list_data/parameters-patterns.txt
     list_data/parameters-vis.txt
-    list_data/parameters-data_exports.txt
 '''
 
+# Parameters from list_data/parameters-data_exports.txt
+PARAMETERS_DATA_EXPORTS = [
+    'AC Longitudinal CofG',
+    'AC Longitudinal CofG Target',
+    'AC Serial Number',
+    'AC Tail',
+    'AC Type',
+    'ADF (1) Bearing',
+    'ADF (1) Frequency',
+    'ADF (2) Bearing',
+    'ADF (2) Frequency',
+    'ALT Knob Pulled',
+    'ALT Knob Pushed',
+    'ALT Knob Rotate',
+    'ALT PB Pressed',
+    'AOA',
+    'AOA (L)',
+    'AOA (L) Indicated',
+    'AOA (R)',
+    'AOA (R) Indicated',
+    'AP (1) Engaged',
+    'AP (1) Engaged (Prim 2)',
+    'AP (1) Engaged (Prim 3)',
+    'AP (1) PB Pressed',
+    'AP (2) Engaged',
+    'AP (2) Engaged (Prim 2)',
+    'AP (2) Engaged (Prim 3)',
+    'AP (2) PB Pressed',
+    'AP (3) Engaged',
+    'AP (Capt) Instinctive Disconnect',
+    'AP (FO) Instinctive Disconnect',
+    'AP Altitude Selected',
+    'AP Channels Engaged',
+    'AP Climb',
+    'AP Engaged',
+    'AP NZ Order',
+    'AP Off Involuntary',
+    'AP Off Voluntary',
+    'AP Roll Order',
+    'AP Slide Slip Order',
+    'AP VNAV',
+    'AP Vertical Mode',
+    'APPR PB Pressed',
+    'APU Bleed Valve Closed',
+    'APU Bleed Valve Open',
+    'APU Fire',
+    'APU Isolation Valve',
+    'APU On',
+    'APU Running',
+    'AT Active',
+    'AT Engaged',
+    'AT Engaged (Prim 2)',
+    'AT Engaged (Prim 3)',
+    'AT PB Pressed',
+    'AT Retard',
+    'Acceleration Across Track',
+    'Acceleration Along Track',
+    'Acceleration Forwards',
+    'Acceleration Lateral',
+    'Acceleration Lateral Offset Removed',
+    'Acceleration Lateral Smoothed',
+    'Acceleration Lateral Unfiltered',
+    'Acceleration Longitudinal',
+    'Acceleration Longitudinal Offset Removed',
+    'Acceleration Longitudinal Unfiltered',
+    'Acceleration Normal',
+    'Acceleration Normal Offset Removed',
+    'Acceleration Normal Unfiltered',
+    'Acceleration Sideways',
+    'Acceleration Vertical',
+    'Aileron',
+    'Aileron (L)',
+    'Aileron (L) Inboard',
+    'Aileron (L) Medium',
+    'Aileron (L) Outboard',
+    'Aileron (R)',
+    'Aileron (R) Inboard',
+    'Aileron (R) Medium',
+    'Aileron (R) Outboard',
+    'Aiming Point Range',
+    'Aircraft Energy',
+    'Aircraft Number',
+    'Airline Three Letter Code',
+    'Airline Two Letter Code',
+    'Airspeed',
+    'Airspeed For Flight Phases',
+    'Airspeed Indicated',
+    'Airspeed Minus Airspeed Selected For 3 Sec',
+    'Airspeed Minus V2',
+    'Airspeed Minus V2 For 3 Sec',
+    'Airspeed Relative',
+    'Airspeed Relative For 3 Sec',
+    'Airspeed Selected',
+    'Airspeed Selected For Approaches',
+    'Airspeed True',
+    'Altitude (GPS)',
+    'Altitude AAL',
+    'Altitude AAL For Flight Phases',
+    'Altitude Alert',
+    'Altitude Baro',
+    'Altitude Constraint Selected',
+    'Altitude QNH',
+    'Altitude Radio',
+    'Altitude Radio (C)',
+    'Altitude Radio (L)',
+    'Altitude Radio (R)',
+    'Altitude Radio Offset Removed',
+    'Altitude Rate',
+    'Altitude STD',
+    'Altitude STD (MMR1)',
+    'Altitude STD (MMR2)',
+    'Altitude STD Smoothed',
+    'Altitude Selected',
+    'Approach Ident',
+    'Approach Range',
+    'Autoland',
+    'Baro Corrected Altitude (Capt)',
+    'Baro Corrected Altitude (FO)',
+    'Barometric Altitude Discrepancy',
+    'Bearing To Go (Capt)',
+    'Bearing To Go (FO)',
+    'Body Pitch Angular Acceleration',
+    'Body Pitch Rate',
+    'Body Pitch Rate Unfiltered',
+    'Body Roll Angular Acceleration',
+    'Body Roll Rate',
+    'Body Roll Rate Unfiltered',
+    'Body Wheel Steering (L) Angle',
+    'Body Wheel Steering (L) Demand Angle',
+    'Body Wheel Steering (R) Angle',
+    'Body Wheel Steering (R) Demand Angle',
+    'Body Yaw Angular Acceleration',
+    'Body Yaw Rate',
+    'Body Yaw Rate Unfiltered',
+    'Brake (*) Temp Avg',
+    'Brake (1-2) Press',
+    'Brake (11-12) Press',
+    'Brake (13-14) Press',
+    'Brake (15-16) Press',
+    'Brake (17-18) Press',
+    'Brake (19-20) Press',
+    'Brake (3-4) Press',
+    'Brake (5-6) Press',
+    'Brake (7-8) Press',
+    'Brake (9-10) Press',
+    'Brake (L) Pedal',
+    'Brake (R) Pedal',
+    'CDS Primary Flight Phase',
+    'Cabin Altitude',
+    'Cabin Altitude Warning',
+    'Cabin Press',
+    'Cabin Press (1)',
+    'Cabin Press (2)',
+    'Cabin Press (3)',
+    'Cabin Press (4)',
+    'Cabin Press Warning',
+    'Centre Tank Fitted',
+    'Climb For Flight Phases',
+    'Configuration',
+    'Control Column',
+    'Control Wheel',
+    'DH Displayed (Capt)',
+    'DH Displayed (FO)',
+    'DME (1)',
+    'DME (1) Frequency',
+    'DME (2)',
+    'DME (2) Frequency',
+    'Date',
+    'Day',
+    'Daylight',
+    'Departure',
+    'Descend For Flight Phases',
+    'Destination',
+    'Distance Flown',
+    'Distance LS Displayed',
+    'Distance To Landing',
+    'Distance Travelled',
+    'Drift',
+    'Dual Input',
+    'ECS Pack (1) High Flow',
+    'ECS Pack (1) Off',
+    'ECS Pack (1) On',
+    'ECS Pack (2) High Flow',
+    'ECS Pack (2) Off',
+    'ECS Pack (2) On',
+    'EPR Target',
+    'Electrical Emergency Configuration Warning',
+    'Elevator',
+    'Elevator (L)',
+    'Elevator (L) Inboard',
+    'Elevator (R)',
+    'Elevator (R) Inboard',
+    'Eng (*) All Running',
+    'Eng (*) Any Running',
+    'Eng (*) Fire',
+    'Eng (*) Fuel Burn',
+    'Eng (*) Fuel Flow',
+    'Eng (*) Fuel Flow Max',
+    'Eng (*) Fuel Flow Min',
+    'Eng (*) Gas Temp Avg',
+    'Eng (*) Gas Temp Max',
+    'Eng (*) Gas Temp Min',
+    'Eng (*) N1 Avg',
+    'Eng (*) N1 Avg For 10 Sec',
+    'Eng (*) N1 Max',
+    'Eng (*) N1 Min',
+    'Eng (*) N1 Min For 5 Sec',
+    'Eng (*) N2 Avg',
+    'Eng (*) N2 Max',
+    'Eng (*) N2 Min',
+    'Eng (*) N3 Avg',
+    'Eng (*) N3 Max',
+    'Eng (*) N3 Min',
+    'Eng (*) Oil Press Avg',
+    'Eng (*) Oil Press Max',
+    'Eng (*) Oil Press Min',
+    'Eng (*) Oil Qty Avg',
+    'Eng (*) Oil Qty Max',
+    'Eng (*) Oil Qty Min',
+    'Eng (*) Oil Temp Avg',
+    'Eng (*) Oil Temp Max',
+    'Eng (*) Oil Temp Min',
+    'Eng (*) Vib N1 Max',
+    'Eng (*) Vib N2 Max',
+    'Eng (*) Vib N3 Max',
+    'Eng (1) 2.5 Bleed Actuator Position',
+    'Eng (1) 2.5 Bleed Position 2 Mode',
+    'Eng (1) 2.5 Bleed Status',
+    'Eng (1) Airborne Vibration Monitoring',
+    'Eng (1) Airborne Vibration Monitoring Yellow-White',
+    'Eng (1) Ambient Press P0',
+    'Eng (1) Anti Ice',
+    'Eng (1) Backflow Warning',
+    'Eng (1) Bleed',
+    'Eng (1) Bleed Duct',
+    'Eng (1) Bleed Fault',
+    'Eng (1) Bleed Off',
+    'Eng (1) Bleed Press',
+    'Eng (1) Bleed Temp',
+    'Eng (1) Bug Drive',
+    'Eng (1) Burner Press',
+    'Eng (1) Channel Dispatch',
+    'Eng (1) EEC Channel In Control',
+    'Eng (1) EEC Channel In Control (L)',
+    'Eng (1) EPR',
+    'Eng (1) EPR Bug Drive',
+    'Eng (1) EPR Command',
+    'Eng (1) ESN',
+    'Eng (1) FCV Closed',
+    'Eng (1) FMV Position',
+    'Eng (1) Fire',
+    'Eng (1) Fuel Burn',
+    'Eng (1) Fuel Cut Off',
+    'Eng (1) Fuel Flow',
+    'Eng (1) Fuel Valve',
+    'Eng (1) Fuel Valve Position',
+    'Eng (1) Gas Press',
+    'Eng (1) Gas Temp',
+    'Eng (1) Generator Load',
+    'Eng (1) HP Compressor Outlet Temp T30',
+    'Eng (1) HP Shutoff Valve Open',
+    'Eng (1) HPC Exit Temp (T3)',
+    'Eng (1) HPV Fully Closed',
+    'Eng (1) IP Compressor Outlet Temp T25',
+    'Eng (1) Inlet Burner Press P30',
+    'Eng (1) Inlet Temp (T2)',
+    'Eng (1) Inlet Total Air Temp T20',
+    'Eng (1) Inlet Total Press P20',
+    'Eng (1) Master Lever On',
+    'Eng (1) N1',
+    'Eng (1) N1 Command',
+    'Eng (1) N1 Limit',
+    'Eng (1) N1 Throttle Resolver',
+    'Eng (1) N1 Vib Advisory Level Exceedance',
+    'Eng (1) N2',
+    'Eng (1) N2 Corrected To 2.5',
+    'Eng (1) N2 Vib Advisory Level Exceedance',
+    'Eng (1) N3',
+    'Eng (1) N3 Vib Advisory Level Exceedance',
+    'Eng (1) Oil Press',
+    'Eng (1) Oil Qty',
+    'Eng (1) Oil Temp',
+    'Eng (1) Overheat',
+    'Eng (1) P0',
+    'Eng (1) P20',
+    'Eng (1) P30',
+    'Eng (1) PRV Fully Closed',
+    'Eng (1) PS3',
+    'Eng (1) PS3 Burner Press',
+    'Eng (1) Relight',
+    'Eng (1) Running',
+    'Eng (1) Start Valve Position',
+    'Eng (1) Starter',
+    'Eng (1) Starter Valve',
+    'Eng (1) Static Press',
+    'Eng (1) Surge Detected',
+    'Eng (1) T20',
+    'Eng (1) T25',
+    'Eng (1) T3 Selected',
+    'Eng (1) T30',
+    'Eng (1) TCAF',
+    'Eng (1) TCAR',
+    'Eng (1) THR Limit',
+    'Eng (1) TPR Command',
+    'Eng (1) TPR Limit',
+    'Eng (1) Throttle Command',
+    'Eng (1) Throttle Lever',
+    'Eng (1) Thrust Reverser Deployed',
+    'Eng (1) Thrust Reverser In Transit',
+    'Eng (1) Total Inlet Press',
+    'Eng (1) Turbine Cooling Air Fwd',
+    'Eng (1) Turbine Cooling Air Rear',
+    'Eng (1) Underheat Warning',
+    'Eng (1) Vib (A)',
+    'Eng (1) Vib (B)',
+    'Eng (1) Vib Broadband',
+    'Eng (1) Vib Broadband Accel A',
+    'Eng (1) Vib Broadband Accel B',
+    'Eng (1) Vib N1',
+    'Eng (1) Vib N2',
+    'Eng (1) Vib N3',
+    'Eng (2) 2.5 Bleed Actuator Position',
+    'Eng (2) 2.5 Bleed Position 2 Mode',
+    'Eng (2) 2.5 Bleed Status',
+    'Eng (2) AOG Reverser Logic',
+    'Eng (2) Airborne Vibration Monitoring',
+    'Eng (2) Airborne Vibration Monitoring Yellow-White',
+    'Eng (2) Ambient Press P0',
+    'Eng (2) Anti Ice',
+    'Eng (2) Backflow Warning',
+    'Eng (2) Bleed',
+    'Eng (2) Bleed Duct',
+    'Eng (2) Bleed Fault',
+    'Eng (2) Bleed Off',
+    'Eng (2) Bleed Press',
+    'Eng (2) Bleed Temp',
+    'Eng (2) Bug Drive',
+    'Eng (2) Burner Press',
+    'Eng (2) Channel Dispatch',
+    'Eng (2) EEC Channel In Control',
+    'Eng (2) EEC Channel In Control (R)',
+    'Eng (2) EEC In Thrust Reverser Test',
+    'Eng (2) EPR',
+    'Eng (2) EPR Bug Drive',
+    'Eng (2) EPR Command',
+    'Eng (2) ESN',
+    'Eng (2) ETRAC 115V Power Supply Available',
+    'Eng (2) FCV Closed',
+    'Eng (2) FMV Position',
+    'Eng (2) Fire',
+    'Eng (2) Fuel Burn',
+    'Eng (2) Fuel Cut Off',
+    'Eng (2) Fuel Flow',
+    'Eng (2) Fuel Valve',
+    'Eng (2) Fuel Valve Position',
+    'Eng (2) Gas Press',
+    'Eng (2) Gas Temp',
+    'Eng (2) Generator Load',
+    'Eng (2) HP Compressor Outlet Temp T30',
+    'Eng (2) HP Shutoff Valve Open',
+    'Eng (2) HPC Exit Temp (T3)',
+    'Eng (2) HPV Fully Closed',
+    'Eng (2) IP Compressor Outlet Temp T25',
+    'Eng (2) Idle Selected Due To Reverser Inadvertent Deployment',
+    'Eng (2) Inlet Burner Press P30',
+    'Eng (2) Inlet Temp (T2)',
+    'Eng (2) Inlet Total Air Temp T20',
+    'Eng (2) Inlet Total Press P20',
+    'Eng (2) Loss Of ETRAC Data',
+    'Eng (2) Master Lever On',
+    'Eng (2) N1',
+    'Eng (2) N1 Command',
+    'Eng (2) N1 Limit',
+    'Eng (2) N1 Throttle Resolver',
+    'Eng (2) N1 Vib Advisory Level Exceedance',
+    'Eng (2) N2',
+    'Eng (2) N2 Corrected To 2.5',
+    'Eng (2) N2 Vib Advisory Level Exceedance',
+    'Eng (2) N3',
+    'Eng (2) N3 Vib Advisory Level Exceedance',
+    'Eng (2) Oil Press',
+    'Eng (2) Oil Qty',
+    'Eng (2) Oil Temp',
+    'Eng (2) Overheat',
+    'Eng (2) P0',
+    'Eng (2) P20',
+    'Eng (2) P30',
+    'Eng (2) PRV Fully Closed',
+    'Eng (2) PS3',
+    'Eng (2) PS3 Burner Press',
+    'Eng (2) Relight',
+    'Eng (2) Reverse Mode Selected',
+    'Eng (2) Reverse Thrust Available',
+    'Eng (2) Reverse Thrust Limited',
+    'Eng (2) Reverser Locked Tertiary Lock Failed',
+    'Eng (2) Reverser Unlocked Tertiary Lock Failed',
+    'Eng (2) Running',
+    'Eng (2) Start Valve Position',
+    'Eng (2) Starter',
+    'Eng (2) Starter Valve',
+    'Eng (2) Static Press',
+    'Eng (2) Surge Detected',
+    'Eng (2) T20',
+    'Eng (2) T25',
+    'Eng (2) T3 Selected',
+    'Eng (2) T30',
+    'Eng (2) TCAF',
+    'Eng (2) TCAR',
+    'Eng (2) THR Limit',
+    'Eng (2) TPR Command',
+    'Eng (2) TPR Limit',
+    'Eng (2) Throttle Command',
+    'Eng (2) Throttle Lever',
+    'Eng (2) Thrust Reverser Control Fault',
+    'Eng (2) Thrust Reverser Deploy Commanded',
+    'Eng (2) Thrust Reverser Deployed',
+    'Eng (2) Thrust Reverser Failed Locked',
+    'Eng (2) Thrust Reverser Fault',
+    'Eng (2) Thrust Reverser Ground Assisted Stow Sequence Active',
+    'Eng (2) Thrust Reverser In Transit',
+    'Eng (2) Thrust Reverser Inhibited',
+    'Eng (2) Thrust Reverser Inhibition Failure',
+    'Eng (2) Thrust Reverser Inoperative',
+    'Eng (2) Thrust Reverser Locked',
+    'Eng (2) Thrust Reverser Loss of Electrical Power',
+    'Eng (2) Thrust Reverser Minor Fault',
+    'Eng (2) Thrust Reverser Not Installed',
+    'Eng (2) Thrust Reverser Overheat Protection Fault',
+    'Eng (2) Thrust Reverser Position',
+    'Eng (2) Thrust Reverser Stow Commanded',
+    'Eng (2) Thrust Reverser System Inadvertently Powered',
+    'Eng (2) Thrust Reverser System Overheat',
+    'Eng (2) Thrust Reverser Unlocked',
+    'Eng (2) Total Inlet Press',
+    'Eng (2) Turbine Cooling Air Fwd',
+    'Eng (2) Turbine Cooling Air Rear',
+    'Eng (2) Underheat Warning',
+    'Eng (2) Vib (A)',
+    'Eng (2) Vib (B)',
+    'Eng (2) Vib Broadband',
+    'Eng (2) Vib Broadband Accel A',
+    'Eng (2) Vib Broadband Accel B',
+    'Eng (2) Vib N1',
+    'Eng (2) Vib N2',
+    'Eng (2) Vib N3',
+    'Eng (3) AOG Reverser Logic',
+    'Eng (3) Backflow Warning',
+    'Eng (3) Bleed',
+    'Eng (3) Bleed Fault',
+    'Eng (3) Bleed Press',
+    'Eng (3) Bleed Temp',
+    'Eng (3) Burner Press',
+    'Eng (3) EEC In Thrust Reverser Test',
+    'Eng (3) EPR',
+    'Eng (3) ESN',
+    'Eng (3) ETRAC 115V Power Supply Available',
+    'Eng (3) FCV Closed',
+    'Eng (3) FMV Position',
+    'Eng (3) Fire',
+    'Eng (3) Fuel Burn',
+    'Eng (3) Fuel Flow',
+    'Eng (3) Gas Temp',
+    'Eng (3) Generator Load',
+    'Eng (3) HP Shutoff Valve Open',
+    'Eng (3) HPV Fully Closed',
+    'Eng (3) Idle Selected Due To Reverser Inadvertent Deployment',
+    'Eng (3) Loss Of ETRAC Data',
+    'Eng (3) Master Lever On',
+    'Eng (3) N1',
+    'Eng (3) N1 Command',
+    'Eng (3) N1 Limit',
+    'Eng (3) N1 Vib Advisory Level Exceedance',
+    'Eng (3) N2',
+    'Eng (3) N2 Vib Advisory Level Exceedance',
+    'Eng (3) N3',
+    'Eng (3) N3 Vib Advisory Level Exceedance',
+    'Eng (3) Oil Press',
+    'Eng (3) Oil Qty',
+    'Eng (3) Oil Temp',
+    'Eng (3) Overheat',
+    'Eng (3) PRV Fully Closed',
+    'Eng (3) Relight',
+    'Eng (3) Reverse Mode Selected',
+    'Eng (3) Reverse Thrust Available',
+    'Eng (3) Reverse Thrust Limited',
+    'Eng (3) Reverser Locked Tertiary Lock Failed',
+    'Eng (3) Reverser Unlocked Tertiary Lock Failed',
+    'Eng (3) Running',
+    'Eng (3) THR Limit',
+    'Eng (3) TPR Command',
+    'Eng (3) TPR Limit',
+    'Eng (3) Throttle Command',
+    'Eng (3) Throttle Lever',
+    'Eng (3) Thrust Reverser Control Fault',
+    'Eng (3) Thrust Reverser Deploy Commanded',
+    'Eng (3) Thrust Reverser Deployed',
+    'Eng (3) Thrust Reverser Failed Locked',
+    'Eng (3) Thrust Reverser Fault',
+    'Eng (3) Thrust Reverser Ground Assisted Stow Sequence Active',
+    'Eng (3) Thrust Reverser Inhibited',
+    'Eng (3) Thrust Reverser Inhibition Failure',
+    'Eng (3) Thrust Reverser Inoperative',
+    'Eng (3) Thrust Reverser Locked',
+    'Eng (3) Thrust Reverser Loss of Electrical Power',
+    'Eng (3) Thrust Reverser Minor Fault',
+    'Eng (3) Thrust Reverser Not Installed',
+    'Eng (3) Thrust Reverser Overheat Protection Fault',
+    'Eng (3) Thrust Reverser Position',
+    'Eng (3) Thrust Reverser Stow Commanded',
+    'Eng (3) Thrust Reverser System Inadvertently Powered',
+    'Eng (3) Thrust Reverser System Overheat',
+    'Eng (3) Thrust Reverser Unlocked',
+    'Eng (3) Underheat Warning',
+    'Eng (3) Vib Broadband Accel A',
+    'Eng (3) Vib Broadband Accel B',
+    'Eng (3) Vib N1',
+    'Eng (3) Vib N2',
+    'Eng (3) Vib N3',
+    'Eng (4) Backflow Warning',
+    'Eng (4) Bleed',
+    'Eng (4) Bleed Fault',
+    'Eng (4) Bleed Press',
+    'Eng (4) Bleed Temp',
+    'Eng (4) Burner Press',
+    'Eng (4) EPR',
+    'Eng (4) ESN',
+    'Eng (4) FCV Closed',
+    'Eng (4) FMV Position',
+    'Eng (4) Fire',
+    'Eng (4) Fuel Burn',
+    'Eng (4) Fuel Flow',
+    'Eng (4) Gas Temp',
+    'Eng (4) Generator Load',
+    'Eng (4) HP Shutoff Valve Open',
+    'Eng (4) HPV Fully Closed',
+    'Eng (4) Master Lever On',
+    'Eng (4) N1',
+    'Eng (4) N1 Command',
+    'Eng (4) N1 Limit',
+    'Eng (4) N1 Vib Advisory Level Exceedance',
+    'Eng (4) N2',
+    'Eng (4) N2 Vib Advisory Level Exceedance',
+    'Eng (4) N3',
+    'Eng (4) N3 Vib Advisory Level Exceedance',
+    'Eng (4) Oil Press',
+    'Eng (4) Oil Qty',
+    'Eng (4) Oil Temp',
+    'Eng (4) Overheat',
+    'Eng (4) PRV Fully Closed',
+    'Eng (4) Relight',
+    'Eng (4) Running',
+    'Eng (4) THR Limit',
+    'Eng (4) TPR Command',
+    'Eng (4) TPR Limit',
+    'Eng (4) Throttle Command',
+    'Eng (4) Throttle Lever',
+    'Eng (4) Underheat Warning',
+    'Eng (4) Vib Broadband Accel A',
+    'Eng (4) Vib Broadband Accel B',
+    'Eng (4) Vib N1',
+    'Eng (4) Vib N2',
+    'Eng (4) Vib N3',
+    'Eng (L) P0 Selected',
+    'Eng (L) P20 Selected',
+    'Eng (L) P30 Selected',
+    'Eng (L) T20 Selected',
+    'Eng (L) T25 Selected',
+    'Eng (L) T30 Selected',
+    'Eng (R) P0 Selected',
+    'Eng (R) P20',
+    'Eng (R) P20 Selected',
+    'Eng (R) P30 Selected',
+    'Eng (R) T20 Selected',
+    'Eng (R) T25 Selected',
+    'Eng (R) T30 Selected',
+    'Event Marker',
+    'FCU AFS Backup Active',
+    'FD (1) Pitch Order',
+    'FD (1) Roll Order',
+    'FD (1) Yaw Order',
+    'FD (2) Pitch Order',
+    'FD (2) Roll Order',
+    'FD (2) Yaw Order',
+    'FD PB Pressed',
+    'FPV Selected (Capt)',
+    'FPV Selected (FO)',
+    'Flap',
+    'Flap Angle',
+    'Flap Excluding Transition',
+    'Flap Including Transition',
+    'Flap Lever',
+    'Flap Lever (Synthetic)',
+    'Flap Lever Angle',
+    'Flap Position',
+    'Flaperon',
+    'Fleet Ident',
+    'Flex Temp',
+    'Flex Temp Valid',
+    'Flight Dir (A) Engaged',
+    'Flight Dir (B) Engaged',
+    'Flight Dir (C) Engaged',
+    'Flight Number',
+    'Flight Path Angle',
+    'Flight Path Angle Selected',
+    'Flight Phase',
+    'Frame Counter',
+    'Fuel Cross Feed Valve',
+    'Fuel Cross Feed Valve Aft',
+    'Fuel Cross Feed Valve Forward',
+    'Fuel Cross Feed Valve Position',
+    'Fuel Jet Pump (L)',
+    'Fuel Jet Pump (R)',
+    'Fuel Pump Aft (L) Low Press',
+    'Fuel Pump Aft (R) Low Press',
+    'Fuel Pump Forward (L) Low Press',
+    'Fuel Pump Forward (R) Low Press',
+    'Fuel Qty',
+    'Fuel Qty (C)',
+    'Fuel Qty (L)',
+    'Fuel Qty (L) (1)',
+    'Fuel Qty (L) (2)',
+    'Fuel Qty (L) (3)',
+    'Fuel Qty (L) (4)',
+    'Fuel Qty (L) (5)',
+    'Fuel Qty (R)',
+    'Fuel Qty (R) (1)',
+    'Fuel Qty (R) (2)',
+    'Fuel Qty (R) (3)',
+    'Fuel Qty (R) (4)',
+    'Fuel Qty (R) (5)',
+    'Fuel Qty (Trim)',
+    'Gear (L) Down',
+    'Gear (L) On Ground',
+    'Gear (N) Down',
+    'Gear (N) On Ground',
+    'Gear (R) Down',
+    'Gear (R) On Ground',
+    'Gear Body (L) Down',
+    'Gear Body (L) On Ground',
+    'Gear Body (R) Down',
+    'Gear Body (R) On Ground',
+    'Gear Down',
+    'Gear Down Selected',
+    'Gear On Ground',
+    'Gear Up Selected',
+    'Global Reference Speed',
+    'Global Wheel Speed',
+    'Gross Weight',
+    'Gross Weight Smoothed',
+    'Groundspeed',
+    'Groundspeed Velocity',
+    'HUD Configuration',
+    'HUD Installed',
+    'Heading',
+    'Heading (FO)',
+    'Heading Continuous',
+    'Heading Discrepancy',
+    'Heading Increasing',
+    'Heading Mag-True (Capt)',
+    'Heading Mag-True (FO)',
+    'Heading Rate',
+    'Heading Selected',
+    'Heading Selected (Capt)',
+    'Heading Selected (FO)',
+    'Heading True',
+    'Heading True Continuous',
+    'Heading-Track Selected',
+    'Headwind',
+    'High Differential Press Excessive',
+    'Hour',
+    'Hyd (Green) Press',
+    'Hyd (Green) Press Low',
+    'Hyd (Yellow) Press',
+    'Hyd (Yellow) Press Low',
+    'ILS (1) Frequency',
+    'ILS (1) Glideslope',
+    'ILS (1) Localizer',
+    'ILS (2) Frequency',
+    'ILS (2) Glideslope',
+    'ILS (2) Localizer',
+    'ILS Frequency',
+    'ILS Glideslope',
+    'ILS Inner Marker',
+    'ILS Lateral Distance',
+    'ILS Localizer',
+    'ILS Localizer PB Pressed',
+    'ILS Middle Marker',
+    'ILS Outer Marker',
+    'Ice Detector (1) Fault',
+    'Ice Detector (2) Fault',
+    'Ice Detector Ice Detected',
+    'Ice Detector Severe Ice Detected',
+    'Index',
+    'Key HF (1)',
+    'Key HF (2)',
+    'Key VHF (1)',
+    'Key VHF (2)',
+    'Key VHF (3)',
+    'Kinetic Energy',
+    'LS Selected (Capt)',
+    'LS Selected (FO)',
+    'Landing Airport ICAO',
+    'Lateral Knob Pulled',
+    'Lateral Knob Pushed',
+    'Lateral Knob Rotate',
+    'Latitude',
+    'Latitude IRU',
+    'Latitude Prepared',
+    'Latitude Smoothed',
+    'Level Flight Monitor',
+    'Longitude',
+    'Longitude IRU',
+    'Longitude Prepared',
+    'Longitude Smoothed',
+    'Loop No (L)',
+    'Loop No (R)',
+    'MMO Lookup',
+    'Mach',
+    'Mach Selected',
+    'Mach Selected (FG)',
+    'Magnetic Track Angle',
+    'Magnetic Variation',
+    'Magnetic Variation From Runway',
+    'Main Landing Gear Bay Fire',
+    'Manual Pitch Trim Down Command',
+    'Manual Pitch Trim Up Command',
+    'Master Caution',
+    'Master Caution (Capt)',
+    'Master Caution (FO)',
+    'Master Engaged (Prim 1)',
+    'Master Engaged (Prim 2)',
+    'Master Engaged (Prim 3)',
+    'Master Warning',
+    'Master Warning (Capt)',
+    'Master Warning (FO)',
+    'Master caution',
+    'Metric Altitude Selected',
+    'Minute',
+    'Month',
+    'Negative Differential Press Excessive',
+    'Nose Wheel Steering COM Angle',
+    'Nose Wheel Steering Demand Angle',
+    'Nose Wheel Steering MON Angle',
+    'Nose Wheel Steering Order',
+    'Nose Wheel Steering Rudder Pedal Order',
+    'PRIM Instinctive Disconnect',
+    'PRIM N1 Target Inboard Engines',
+    'PRIM N1 Target Outboard Engines',
+    'Pilot Flying',
+    'Pitch',
+    'Pitch Discrepancy',
+    'Pitch Equivalent Order',
+    'Pitch Rate',
+    'Pitch Trim Double Pressurization',
+    'Pitch Unfiltered',
+    'Potential Energy',
+    'Primary Flight Phase',
+    'Prog Ident',
+    'Reactive Windshear',
+    'Relief',
+    'Roll',
+    'Roll Discrepancy',
+    'Roll Equivalent Order',
+    'Roll Rate',
+    'Roll Unfiltered',
+    'Rudder',
+    'Rudder (Lower)',
+    'Rudder (Lower) Actuator (1) Available',
+    'Rudder (Lower) Actuator (2) Available',
+    'Rudder (Lower) Double Pressurization',
+    'Rudder (Lower) Travel Limit',
+    'Rudder (Upper)',
+    'Rudder (Upper) Actuator (1) Available',
+    'Rudder (Upper) Actuator (2) Available',
+    'Rudder (Upper) Double Pressurization',
+    'Rudder (Upper) Travel Limit',
+    'Rudder Pedal',
+    'SAT',
+    'SAT (1)',
+    'SAT (2)',
+    'SAT (3)',
+    'SAT International Standard Atmosphere',
+    'SCS Side (1) In Control',
+    'SCS Side (2) In Control',
+    'SUBFRAME COUNTER',
+    'Second',
+    'Side Slip Angle Corrected',
+    'Side Slip Angle Indicated',
+    'Sidestick Angle (Capt)',
+    'Sidestick Angle (FO)',
+    'Sidestick Pitch (Capt)',
+    'Sidestick Pitch (FO)',
+    'Sidestick Roll (Capt)',
+    'Sidestick Roll (FO)',
+    'Slat',
+    'Slat Angle',
+    'Slat Excluding Transition',
+    'Slat Including Transition',
+    'Slat Lever',
+    'Slope Angle To Landing',
+    'Slope To Landing',
+    'Speed Knob Pulled',
+    'Speed Knob Pushed',
+    'Speed Knob Rotate',
+    'Speedbrake',
+    'Speedbrake Armed',
+    'Speedbrake Commanded',
+    'Speedbrake Deployed',
+    'Speedbrake Handle',
+    'Speedbrake Handle Position',
+    'Speedbrake Selected',
+    'Spoiler (1 and 3) Available',
+    'Spoiler (1)',
+    'Spoiler (2 and 4) Available',
+    'Spoiler (2)',
+    'Spoiler (3)',
+    'Spoiler (4)',
+    'Stabilizer',
+    'Stable Approach',
+    'Standard Altitude Discrepancy',
+    'Stationary',
+    'Stator Vane (L)',
+    'Stator Vane (R)',
+    'Steering Hand Wheel Order (Capt)',
+    'Steering Hand Wheel Order (FO)',
+    'Superframe Counter',
+    'TAT',
+    'TAWS Alert Message Matrix',
+    'TAWS Display',
+    'TAWS Failed',
+    'TAWS Inhibit',
+    'TAWS Terrain Awareness Failed',
+    'TAWS Terrain Mode',
+    'TAWS Terrain Obstacle Awareness Caution',
+    'TAWS Terrain Obstacle Awareness Warning',
+    'TAWS Unspecified',
+    'TAWS Warning',
+    'TCAFVALIDATED_EECRRL_T 1Hz_1166',
+    'TCAFVALIDATED_EECRRR_T 1Hz_1167',
+    'TCARVALIDATED_EECRRL_T 1Hz_1168',
+    'TCARVALIDATED_EECRRR_T 1Hz_1169',
+    'TCAS Combined Control',
+    'TCAS Down Advisory',
+    'TCAS Sensitivity Level Control',
+    'TCAS Up Advisory',
+    'TCAS Vertical Control',
+    'THS Actuator (1) Available',
+    'THS Actuator (2) Available',
+    'THS Actuator (3) Available',
+    'TMC VNAV Operating',
+    'Tail Number',
+    'Tailwind',
+    'Takeoff Airport ICAO',
+    'Takeoff Configuration Flap Warning',
+    'Takeoff Configuration Rudder Trim Warning',
+    'Takeoff Configuration Slat Warning',
+    'Takeoff Configuration Stabilizer Warning',
+    'Takeoff Configuration Warning',
+    'Takeoff Datetime',
+    'Takeoff Thrust Disagree',
+    'Takeoff Weight',
+    'Throttle Levers',
+    'Thrust Asymmetry',
+    'Thrust Reversers',
+    'Thrust Reversers Effective',
+    'Time',
+    'Track',
+    'Track Angle Rate',
+    'Track Continuous',
+    'Track Deviation From Runway',
+    'Track True',
+    'Track True Continuous',
+    'True Track Angle',
+    'Turbulence',
+    'VMO Lookup',
+    'VOR (1) Bearing',
+    'VOR (1) Course Selected',
+    'VOR (1) Frequency',
+    'VOR (2) Bearing',
+    'VOR (2) Course Selected',
+    'VOR (2) Frequency',
+    'VS Knob Pulled',
+    'VS Knob Rotate',
+    'Vertical Speed',
+    'Vertical Speed For Flight Phases',
+    'Vertical Speed GPS',
+    'Vertical Speed Inertial',
+    'Vertical Speed Inertial Recorded',
+    'Vertical Speed Selected',
+    'Vertical Speed Selected (FG)',
+    'Vref',
+    'WBBC Aft CofG Warning',
+    'WBBC CofG',
+    'WBBC Weight',
+    'Wheel Speed',
+    'Wheel Speed (C) (1)',
+    'Wheel Speed (C) (2)',
+    'Wheel Speed (C) (3)',
+    'Wheel Speed (C) (4)',
+    'Wheel Speed (L)',
+    'Wheel Speed (L) (1)',
+    'Wheel Speed (L) (2)',
+    'Wheel Speed (L) (3)',
+    'Wheel Speed (L) (4)',
+    'Wheel Speed (L) (5)',
+    'Wheel Speed (L) (6)',
+    'Wheel Speed (L) (7)',
+    'Wheel Speed (L) (8)',
+    'Wheel Speed (R)',
+    'Wheel Speed (R) (1)',
+    'Wheel Speed (R) (2)',
+    'Wheel Speed (R) (3)',
+    'Wheel Speed (R) (4)',
+    'Wheel Speed (R) (5)',
+    'Wheel Speed (R) (6)',
+    'Wheel Speed (R) (7)',
+    'Wheel Speed (R) (8)',
+    'Wind Across Landing Runway',
+    'Wind Direction',
+    'Wind Direction Continuous',
+    'Wind Direction True',
+    'Wind Direction True Continuous',
+    'Wind Speed',
+    'Wing (L) Anti Ice Valve',
+    'Wing (R) Anti Ice Valve',
+    'Yaw',
+    'Yaw Trim Position',
+    'Year',
+    'Zero Fuel Weight',
+]
+
 # Parameters from list_data/parameters-patterns.txt
 PARAMETERS_PATTERNS = [
     '115 VAC Standby Bus',
@@ -714,26 +1645,65 @@ PARAMETERS_VIS = [
     'Wind Speed',
 ]
 
-# Parameters from list_data/parameters-data_exports.txt
-PARAMETERS_DATA_EXPORTS = [
+# List of all parameters from all files with duplicates removed.
+PARAMETERS_FROM_FILES = [
+    '115 VAC Standby Bus',
+    '115 VAC Unavailable To IGN (*) (*)',
+    '115 VAC XFR Bus',
+    '28 VDC Battery Bus',
+    '28 VDC Battery Bus Hot',
+    '28 VDC Battery Bus Switch Hot',
+    '28 VDC Bus (*)',
+    '28 VDC Standby Bus',
+    'AC Emergency Bus Fail',
+    'AC Essential Bus Fail',
     'AC Longitudinal CofG',
     'AC Longitudinal CofG Target',
     'AC Serial Number',
     'AC Tail',
     'AC Type',
+    'ADF (*) Frequency',
+    'ADF (*) Selected (*)',
     'ADF (1) Bearing',
     'ADF (1) Frequency',
     'ADF (2) Bearing',
     'ADF (2) Frequency',
+    'AFCAS Active Lateral Mode',
+    'AFCAS Active Lateral Mode Capture',
+    'AFCAS Active Lateral Mode FMS',
+    'AFCAS Active Lateral Mode Failure',
+    'AFCAS Active Lateral Mode Valid',
+    'AFCAS Active Path Mode',
+    'AFCAS Active Path Mode Capture',
+    'AFCAS Active Path Mode FMS',
+    'AFCAS Active Path Mode Failure',
+    'AFCAS Active Path Mode Valid',
+    'AFCAS Active Path Parameter Controlled',
+    'AFCAS Active Speed Mode',
+    'AFCAS Active Speed Mode AT Limit',
+    'AFCAS Active Speed Mode Capture',
+    'AFCAS Active Speed Mode FMS',
+    'AFCAS Active Speed Mode Failure',
+    'AFCAS Active Speed Mode Valid',
+    'AFCAS Active Speed Parameter Controlled',
+    'AFCAS Active Thrust Mode',
+    'AFCAS Active Thrust Mode AT Limit',
+    'AFCAS Active Thrust Mode Capture',
+    'AFCAS Active Thrust Mode FMS',
+    'AFCAS Active Thrust Mode Failure',
+    'AFCAS Active Thrust Mode Valid',
     'ALT Knob Pulled',
     'ALT Knob Pushed',
     'ALT Knob Rotate',
     'ALT PB Pressed',
     'AOA',
+    'AOA (*)',
     'AOA (L)',
     'AOA (L) Indicated',
     'AOA (R)',
     'AOA (R) Indicated',
+    'AP (*) Disconnect',
+    'AP (*) Engaged',
     'AP (1) Engaged',
     'AP (1) Engaged (Prim 2)',
     'AP (1) Engaged (Prim 3)',
@@ -746,29 +1716,60 @@ PARAMETERS_DATA_EXPORTS = [
     'AP (Capt) Instinctive Disconnect',
     'AP (FO) Instinctive Disconnect',
     'AP Altitude Selected',
+    'AP Backcourse',
     'AP Channels Engaged',
     'AP Climb',
+    'AP Collective ALTA',
+    'AP Collective GS (*)',
+    'AP Collective Glideslope',
+    'AP Collective Mode (*)',
     'AP Engaged',
+    'AP F-TDN Button',
+    'AP FD Engage Status',
+    'AP ILS (*)',
+    'AP ILS Localizer',
+    'AP Lateral Mode',
+    'AP Manual Disconnect',
     'AP NZ Order',
     'AP Off Involuntary',
     'AP Off Voluntary',
+    'AP Pitch ALTA',
+    'AP Pitch GS (*)',
+    'AP Pitch Glideslope',
+    'AP Pitch Mode (*)',
     'AP Roll Order',
+    'AP Roll-Yaw Mode (*)',
     'AP Slide Slip Order',
+    'AP Touchdown',
+    'AP Trim Down',
     'AP VNAV',
+    'AP VOR (*)',
     'AP Vertical Mode',
+    'AP Warning',
     'APPR PB Pressed',
+    'APU Bleed Air Switch',
     'APU Bleed Valve Closed',
     'APU Bleed Valve Open',
     'APU Fire',
+    'APU Fuel Flow',
+    'APU Gas Temp',
     'APU Isolation Valve',
     'APU On',
     'APU Running',
+    'AT (*) Engaged',
     'AT Active',
     'AT Engaged',
     'AT Engaged (Prim 2)',
     'AT Engaged (Prim 3)',
+    'AT FMC Speed',
+    'AT Go Around',
+    'AT Limit',
+    'AT MCP Speed',
+    'AT Min Speed',
+    'AT N1',
     'AT PB Pressed',
     'AT Retard',
+    'AT Warning',
     'Acceleration Across Track',
     'Acceleration Along Track',
     'Acceleration Forwards',
@@ -785,6 +1786,11 @@ PARAMETERS_DATA_EXPORTS = [
     'Acceleration Sideways',
     'Acceleration Vertical',
     'Aileron',
+    'Aileron (*)',
+    'Aileron (*) Actuator',
+    'Aileron (*) Inboard',
+    'Aileron (*) Outboard',
+    'Aileron (*) Roll Command',
     'Aileron (L)',
     'Aileron (L) Inboard',
     'Aileron (L) Medium',
@@ -793,46 +1799,88 @@ PARAMETERS_DATA_EXPORTS = [
     'Aileron (R) Inboard',
     'Aileron (R) Medium',
     'Aileron (R) Outboard',
+    'Aileron Actuator',
+    'Aileron Inboard',
+    'Aileron Outboard',
+    'Aileron Quadrant',
+    'Aileron Roll Command',
+    'Aileron Trim',
+    'Aileron Trim (*)',
     'Aiming Point Range',
     'Aircraft Energy',
     'Aircraft Number',
+    'Airframe Anti Ice',
     'Airline Three Letter Code',
     'Airline Two Letter Code',
+    'Airports Selected (*)',
     'Airspeed',
     'Airspeed For Flight Phases',
     'Airspeed Indicated',
     'Airspeed Minus Airspeed Selected For 3 Sec',
     'Airspeed Minus V2',
     'Airspeed Minus V2 For 3 Sec',
+    'Airspeed Reference',
     'Airspeed Relative',
     'Airspeed Relative For 3 Sec',
     'Airspeed Selected',
+    'Airspeed Selected (*)',
+    'Airspeed Selected (FMC)',
     'Airspeed Selected For Approaches',
     'Airspeed True',
+    'Alpha (*) Floor',
+    'Alpha Floor',
+    'Altimeter (*) Pressure Correction',
+    'Altitude (*) Selected',
     'Altitude (GPS)',
     'Altitude AAL',
     'Altitude AAL For Flight Phases',
+    'Altitude AGL',
+    'Altitude Acq',
+    'Altitude Acquire',
     'Altitude Alert',
     'Altitude Baro',
+    'Altitude Baro (*)',
+    'Altitude Baro QFE (*)',
+    'Altitude Constraint',
     'Altitude Constraint Selected',
+    'Altitude Hold',
+    'Altitude Hold Push Button Light',
     'Altitude QNH',
     'Altitude Radio',
+    'Altitude Radio (*)',
+    'Altitude Radio (*) (*)',
     'Altitude Radio (C)',
     'Altitude Radio (L)',
     'Altitude Radio (R)',
     'Altitude Radio Offset Removed',
     'Altitude Rate',
+    'Altitude Reference Active',
     'Altitude STD',
+    'Altitude STD (*)',
+    'Altitude STD (Fine)',
     'Altitude STD (MMR1)',
     'Altitude STD (MMR2)',
+    'Altitude STD Low',
     'Altitude STD Smoothed',
     'Altitude Selected',
+    'Altitude Selected (*)',
+    'Altitude Selected (FMC)',
     'Approach Ident',
+    'Approach Idle (*) Selected',
+    'Approach Mode Selected (*)',
     'Approach Range',
+    'Assumed Temp Derate',
+    'Auto Speedbrake Extend',
+    'Autobrake Applied',
     'Autoland',
+    'Autoland Enabled',
+    'Autothrottle Engaged',
+    'Back Course Mode Engaged',
+    'Backcourse Engaged',
     'Baro Corrected Altitude (Capt)',
     'Baro Corrected Altitude (FO)',
     'Barometric Altitude Discrepancy',
+    'Battery (*) Overheat',
     'Bearing To Go (Capt)',
     'Bearing To Go (FO)',
     'Body Pitch Angular Acceleration',
@@ -848,6 +1896,8 @@ PARAMETERS_DATA_EXPORTS = [
     'Body Yaw Angular Acceleration',
     'Body Yaw Rate',
     'Body Yaw Rate Unfiltered',
+    'Brake (*) Alternate Press',
+    'Brake (*) Press',
     'Brake (*) Temp Avg',
     'Brake (1-2) Press',
     'Brake (11-12) Press',
@@ -861,6 +1911,11 @@ PARAMETERS_DATA_EXPORTS = [
     'Brake (9-10) Press',
     'Brake (L) Pedal',
     'Brake (R) Pedal',
+    'Brake Alternate Press',
+    'Brake Main Selected',
+    'Brake Pressure',
+    'Brake Pressure  (*)',
+    'Brake Pressure (*)',
     'CDS Primary Flight Phase',
     'Cabin Altitude',
     'Cabin Altitude Warning',
@@ -870,28 +1925,66 @@ PARAMETERS_DATA_EXPORTS = [
     'Cabin Press (3)',
     'Cabin Press (4)',
     'Cabin Press Warning',
+    'Centre Of Gravity',
     'Centre Tank Fitted',
     'Climb For Flight Phases',
+    'Collective (*)',
+    'Collective (1)',
+    'Collective Output (*)',
+    'Command (*)',
+    'Config',
     'Configuration',
     'Control Column',
+    'Control Column (*)',
+    'Control Column (Capt)',
+    'Control Column (FO)',
+    'Control Column Force',
+    'Control Column Force (*)',
+    'Control Column Force (FO)',
+    'Control Column Force (Foreign)',
+    'Control Column Force (Local)',
     'Control Wheel',
+    'Control Wheel (*)',
+    'Control Wheel (Capt)',
+    'Control Wheel (FO)',
+    'Control Wheel Force',
+    'Control Wheel Steering (*) Engaged',
+    'Control Wheel Steering Pitch Engaged',
+    'Control Wheel Steering Roll Engaged',
+    'Crosstrack Rate Latitude Over 0 Ft Sec',
+    'Cyclic Fore-Aft (*)',
+    'Cyclic Fore-Aft Output (*)',
+    'Cyclic Lateral (*)',
+    'Cyclic Lateral Output (*)',
+    'DEU Centre Display Format (*)',
+    'DEU Check List',
+    'DH (*) Selected',
     'DH Displayed (Capt)',
     'DH Displayed (FO)',
+    'DH Selected',
+    'DH Selected (*)',
+    'DME',
+    'DME (*)',
+    'DME (*) Frequency',
     'DME (1)',
     'DME (1) Frequency',
     'DME (2)',
     'DME (2) Frequency',
+    'Data Broadcast Mode (*)',
     'Date',
     'Day',
     'Daylight',
     'Departure',
     'Descend For Flight Phases',
     'Destination',
+    'Display Unit (*) Format',
+    'Displayed App Source (*)',
     'Distance Flown',
     'Distance LS Displayed',
     'Distance To Landing',
     'Distance Travelled',
     'Drift',
+    'Drift (*)',
     'Dual Input',
     'ECS Pack (1) High Flow',
     'ECS Pack (1) Off',
@@ -899,45 +1992,104 @@ PARAMETERS_DATA_EXPORTS = [
     'ECS Pack (2) High Flow',
     'ECS Pack (2) Off',
     'ECS Pack (2) On',
+    'EFIS Mode Selected (*)',
+    'EFIS Scale Selected (*)',
+    'EID (*) Submodes Page',
     'EPR Target',
     'Electrical Emergency Configuration Warning',
     'Elevator',
+    'Elevator (*)',
     'Elevator (L)',
     'Elevator (L) Inboard',
     'Elevator (R)',
     'Elevator (R) Inboard',
+    'Elevator Trim',
+    'Elevator Trim (*)',
+    'Eng (*) Airborne Vibration Monitoring',
+    'Eng (*) Aircraft Type Code',
     'Eng (*) All Running',
+    'Eng (*) Anti Ice',
+    'Eng (*) Anti Ice Configuration Code',
     'Eng (*) Any Running',
+    'Eng (*) Bleed',
+    'Eng (*) Chip Detector',
+    'Eng (*) Cutoff',
+    'Eng (*) EEC On Ground Selected',
+    'Eng (*) EPR',
+    'Eng (*) Fault Dispatch Level (A)',
     'Eng (*) Fire',
+    'Eng (*) Flameout Protection On',
     'Eng (*) Fuel Burn',
     'Eng (*) Fuel Flow',
     'Eng (*) Fuel Flow Max',
     'Eng (*) Fuel Flow Min',
+    'Eng (*) Gas Temp',
     'Eng (*) Gas Temp Avg',
     'Eng (*) Gas Temp Max',
     'Eng (*) Gas Temp Min',
+    'Eng (*) Gas Temp Redline',
+    'Eng (*) Hot Start',
+    'Eng (*) Hot Start Detected',
+    'Eng (*) Hyd (*)',
+    'Eng (*) ITT',
+    'Eng (*) N1',
     'Eng (*) N1 Avg',
     'Eng (*) N1 Avg For 10 Sec',
+    'Eng (*) N1 Command',
     'Eng (*) N1 Max',
+    'Eng (*) N1 Max Climb Rating',
     'Eng (*) N1 Min',
     'Eng (*) N1 Min For 5 Sec',
+    'Eng (*) N1 Redline',
+    'Eng (*) N1 Target',
+    'Eng (*) N1 Trim',
+    'Eng (*) N2',
     'Eng (*) N2 Avg',
     'Eng (*) N2 Max',
     'Eng (*) N2 Min',
+    'Eng (*) N2 Redline',
+    'Eng (*) N2 Tachometer',
+    'Eng (*) N3',
     'Eng (*) N3 Avg',
     'Eng (*) N3 Max',
     'Eng (*) N3 Min',
+    'Eng (*) Np',
+    'Eng (*) Np [RPM]',
+    'Eng (*) Oil Filter Impending Bypass',
+    'Eng (*) Oil Press',
+    'Eng (*) Oil Press Amber Limit',
     'Eng (*) Oil Press Avg',
+    'Eng (*) Oil Press Low',
+    'Eng (*) Oil Press Low Red Warning',
     'Eng (*) Oil Press Max',
     'Eng (*) Oil Press Min',
+    'Eng (*) Oil Qty',
     'Eng (*) Oil Qty Avg',
     'Eng (*) Oil Qty Max',
     'Eng (*) Oil Qty Min',
+    'Eng (*) Oil Temp',
     'Eng (*) Oil Temp Avg',
     'Eng (*) Oil Temp Max',
     'Eng (*) Oil Temp Min',
+    'Eng (*) P0 Sensor Selected',
+    'Eng (*) Panel Mode',
+    'Eng (*) Reverse Thrust Limited By Thrust Reverser',
+    'Eng (*) Speed Regulator',
+    'Eng (*) Starter Valve',
+    'Eng (*) TPR',
+    'Eng (*) TR',
+    'Eng (*) Throttle Lever',
+    'Eng (*) Thrust Reverser (*) Deployed',
+    'Eng (*) Thrust Reverser (*) Sleeve',
+    'Eng (*) Thrust Reverser In Transit',
+    'Eng (*) Torque',
+    'Eng (*) Turbine Inlet Temp',
+    'Eng (*) Vib N1 Fan',
     'Eng (*) Vib N1 Max',
+    'Eng (*) Vib N1 Turbine',
+    'Eng (*) Vib N2 Compressor',
     'Eng (*) Vib N2 Max',
+    'Eng (*) Vib N2 Turbine',
     'Eng (*) Vib N3 Max',
     'Eng (1) 2.5 Bleed Actuator Position',
     'Eng (1) 2.5 Bleed Position 2 Mode',
@@ -954,6 +2106,7 @@ PARAMETERS_DATA_EXPORTS = [
     'Eng (1) Bleed Press',
     'Eng (1) Bleed Temp',
     'Eng (1) Bug Drive',
+    'Eng (1) Burner Press',
     'Eng (1) Channel Dispatch',
     'Eng (1) EEC Channel In Control',
     'Eng (1) EEC Channel In Control (L)',
@@ -969,13 +2122,16 @@ PARAMETERS_DATA_EXPORTS = [
     'Eng (1) Fuel Flow',
     'Eng (1) Fuel Valve',
     'Eng (1) Fuel Valve Position',
+    'Eng (1) Gas Press',
     'Eng (1) Gas Temp',
     'Eng (1) Generator Load',
     'Eng (1) HP Compressor Outlet Temp T30',
     'Eng (1) HP Shutoff Valve Open',
+    'Eng (1) HPC Exit Temp (T3)',
     'Eng (1) HPV Fully Closed',
     'Eng (1) IP Compressor Outlet Temp T25',
     'Eng (1) Inlet Burner Press P30',
+    'Eng (1) Inlet Temp (T2)',
     'Eng (1) Inlet Total Air Temp T20',
     'Eng (1) Inlet Total Press P20',
     'Eng (1) Master Lever On',
@@ -989,6 +2145,7 @@ PARAMETERS_DATA_EXPORTS = [
     'Eng (1) N2 Vib Advisory Level Exceedance',
     'Eng (1) N3',
     'Eng (1) N3 Vib Advisory Level Exceedance',
+    'Eng (1) Np',
     'Eng (1) Oil Press',
     'Eng (1) Oil Qty',
     'Eng (1) Oil Temp',
@@ -997,14 +2154,18 @@ PARAMETERS_DATA_EXPORTS = [
     'Eng (1) P20',
     'Eng (1) P30',
     'Eng (1) PRV Fully Closed',
+    'Eng (1) PS3',
+    'Eng (1) PS3 Burner Press',
     'Eng (1) Relight',
     'Eng (1) Running',
     'Eng (1) Start Valve Position',
     'Eng (1) Starter',
     'Eng (1) Starter Valve',
+    'Eng (1) Static Press',
     'Eng (1) Surge Detected',
     'Eng (1) T20',
     'Eng (1) T25',
+    'Eng (1) T3 Selected',
     'Eng (1) T30',
     'Eng (1) TCAF',
     'Eng (1) TCAR',
@@ -1015,6 +2176,8 @@ PARAMETERS_DATA_EXPORTS = [
     'Eng (1) Throttle Lever',
     'Eng (1) Thrust Reverser Deployed',
     'Eng (1) Thrust Reverser In Transit',
+    'Eng (1) Torque',
+    'Eng (1) Total Inlet Press',
     'Eng (1) Turbine Cooling Air Fwd',
     'Eng (1) Turbine Cooling Air Rear',
     'Eng (1) Underheat Warning',
@@ -1042,6 +2205,7 @@ PARAMETERS_DATA_EXPORTS = [
     'Eng (2) Bleed Press',
     'Eng (2) Bleed Temp',
     'Eng (2) Bug Drive',
+    'Eng (2) Burner Press',
     'Eng (2) Channel Dispatch',
     'Eng (2) EEC Channel In Control',
     'Eng (2) EEC Channel In Control (R)',
@@ -1059,14 +2223,17 @@ PARAMETERS_DATA_EXPORTS = [
     'Eng (2) Fuel Flow',
     'Eng (2) Fuel Valve',
     'Eng (2) Fuel Valve Position',
+    'Eng (2) Gas Press',
     'Eng (2) Gas Temp',
     'Eng (2) Generator Load',
     'Eng (2) HP Compressor Outlet Temp T30',
     'Eng (2) HP Shutoff Valve Open',
+    'Eng (2) HPC Exit Temp (T3)',
     'Eng (2) HPV Fully Closed',
     'Eng (2) IP Compressor Outlet Temp T25',
     'Eng (2) Idle Selected Due To Reverser Inadvertent Deployment',
     'Eng (2) Inlet Burner Press P30',
+    'Eng (2) Inlet Temp (T2)',
     'Eng (2) Inlet Total Air Temp T20',
     'Eng (2) Inlet Total Press P20',
     'Eng (2) Loss Of ETRAC Data',
@@ -1081,6 +2248,7 @@ PARAMETERS_DATA_EXPORTS = [
     'Eng (2) N2 Vib Advisory Level Exceedance',
     'Eng (2) N3',
     'Eng (2) N3 Vib Advisory Level Exceedance',
+    'Eng (2) Np',
     'Eng (2) Oil Press',
     'Eng (2) Oil Qty',
     'Eng (2) Oil Temp',
@@ -1089,6 +2257,8 @@ PARAMETERS_DATA_EXPORTS = [
     'Eng (2) P20',
     'Eng (2) P30',
     'Eng (2) PRV Fully Closed',
+    'Eng (2) PS3',
+    'Eng (2) PS3 Burner Press',
     'Eng (2) Relight',
     'Eng (2) Reverse Mode Selected',
     'Eng (2) Reverse Thrust Available',
@@ -1099,9 +2269,11 @@ PARAMETERS_DATA_EXPORTS = [
     'Eng (2) Start Valve Position',
     'Eng (2) Starter',
     'Eng (2) Starter Valve',
+    'Eng (2) Static Press',
     'Eng (2) Surge Detected',
     'Eng (2) T20',
     'Eng (2) T25',
+    'Eng (2) T3 Selected',
     'Eng (2) T30',
     'Eng (2) TCAF',
     'Eng (2) TCAR',
@@ -1130,6 +2302,8 @@ PARAMETERS_DATA_EXPORTS = [
     'Eng (2) Thrust Reverser System Inadvertently Powered',
     'Eng (2) Thrust Reverser System Overheat',
     'Eng (2) Thrust Reverser Unlocked',
+    'Eng (2) Torque',
+    'Eng (2) Total Inlet Press',
     'Eng (2) Turbine Cooling Air Fwd',
     'Eng (2) Turbine Cooling Air Rear',
     'Eng (2) Underheat Warning',
@@ -1147,6 +2321,7 @@ PARAMETERS_DATA_EXPORTS = [
     'Eng (3) Bleed Fault',
     'Eng (3) Bleed Press',
     'Eng (3) Bleed Temp',
+    'Eng (3) Burner Press',
     'Eng (3) EEC In Thrust Reverser Test',
     'Eng (3) EPR',
     'Eng (3) ESN',
@@ -1171,6 +2346,7 @@ PARAMETERS_DATA_EXPORTS = [
     'Eng (3) N2 Vib Advisory Level Exceedance',
     'Eng (3) N3',
     'Eng (3) N3 Vib Advisory Level Exceedance',
+    'Eng (3) Np',
     'Eng (3) Oil Press',
     'Eng (3) Oil Qty',
     'Eng (3) Oil Temp',
@@ -1207,6 +2383,7 @@ PARAMETERS_DATA_EXPORTS = [
     'Eng (3) Thrust Reverser System Inadvertently Powered',
     'Eng (3) Thrust Reverser System Overheat',
     'Eng (3) Thrust Reverser Unlocked',
+    'Eng (3) Torque',
     'Eng (3) Underheat Warning',
     'Eng (3) Vib Broadband Accel A',
     'Eng (3) Vib Broadband Accel B',
@@ -1218,6 +2395,7 @@ PARAMETERS_DATA_EXPORTS = [
     'Eng (4) Bleed Fault',
     'Eng (4) Bleed Press',
     'Eng (4) Bleed Temp',
+    'Eng (4) Burner Press',
     'Eng (4) EPR',
     'Eng (4) ESN',
     'Eng (4) FCV Closed',
@@ -1238,6 +2416,7 @@ PARAMETERS_DATA_EXPORTS = [
     'Eng (4) N2 Vib Advisory Level Exceedance',
     'Eng (4) N3',
     'Eng (4) N3 Vib Advisory Level Exceedance',
+    'Eng (4) Np',
     'Eng (4) Oil Press',
     'Eng (4) Oil Qty',
     'Eng (4) Oil Temp',
@@ -1250,6 +2429,7 @@ PARAMETERS_DATA_EXPORTS = [
     'Eng (4) TPR Limit',
     'Eng (4) Throttle Command',
     'Eng (4) Throttle Lever',
+    'Eng (4) Torque',
     'Eng (4) Underheat Warning',
     'Eng (4) Vib Broadband Accel A',
     'Eng (4) Vib Broadband Accel B',
@@ -1269,6 +2449,24 @@ PARAMETERS_DATA_EXPORTS = [
     'Eng (R) T20 Selected',
     'Eng (R) T25 Selected',
     'Eng (R) T30 Selected',
+    'Eng EPR',
+    'Eng Fuel Flow',
+    'Eng Gas Temp',
+    'Eng ITT',
+    'Eng N1',
+    'Eng N1 Command',
+    'Eng N1 Target',
+    'Eng N2',
+    'Eng N3',
+    'Eng Np',
+    'Eng Np [RPM]',
+    'Eng Oil Press',
+    'Eng Oil Temp',
+    'Eng TR',
+    'Eng Throttle Lever',
+    'Eng Vib N1 Fan',
+    'Eng Vib N1 Turbine',
+    'Eng Vib N2 Compressor',
     'Event Marker',
     'FCU AFS Backup Active',
     'FD (1) Pitch Order',
@@ -1278,26 +2476,47 @@ PARAMETERS_DATA_EXPORTS = [
     'FD (2) Roll Order',
     'FD (2) Yaw Order',
     'FD PB Pressed',
+    'FMC Primary Navigation Source Selected',
+    'FMC Selected Navigation Source',
+    'FMC Static Air Temperature',
     'FPV Selected (Capt)',
     'FPV Selected (FO)',
+    'Final Approach Course Engaged',
     'Flap',
     'Flap Angle',
+    'Flap Angle (*)',
     'Flap Excluding Transition',
     'Flap Including Transition',
+    'Flap Leading Edge (*) Extended',
+    'Flap Leading Edge (*) In Transit',
     'Flap Lever',
     'Flap Lever (Synthetic)',
     'Flap Lever Angle',
+    'Flap Lever Detent',
+    'Flap Lever Position',
     'Flap Position',
+    'Flap Skew (*) Position',
+    'Flap Skew (1-8)',
+    'Flap Split Needle CW',
+    'Flap Surface',
     'Flaperon',
+    'Flare Armed',
+    'Flare Engaged',
     'Fleet Ident',
     'Flex Temp',
     'Flex Temp Valid',
+    'Flight Dir (*) Engaged',
     'Flight Dir (A) Engaged',
     'Flight Dir (B) Engaged',
     'Flight Dir (C) Engaged',
+    'Flight Dir Pitch',
+    'Flight Dir Pitch (*)',
+    'Flight Dir Roll',
+    'Flight Dir Roll (*)',
     'Flight Number',
     'Flight Path Angle',
     'Flight Path Angle Selected',
+    'Flight Path Vector Selected (*)',
     'Flight Phase',
     'Frame Counter',
     'Fuel Cross Feed Valve',
@@ -1311,6 +2530,9 @@ PARAMETERS_DATA_EXPORTS = [
     'Fuel Pump Forward (L) Low Press',
     'Fuel Pump Forward (R) Low Press',
     'Fuel Qty',
+    'Fuel Qty (*)',
+    'Fuel Qty (*) (*)',
+    'Fuel Qty (Aux)',
     'Fuel Qty (C)',
     'Fuel Qty (L)',
     'Fuel Qty (L) (1)',
@@ -1325,6 +2547,19 @@ PARAMETERS_DATA_EXPORTS = [
     'Fuel Qty (R) (4)',
     'Fuel Qty (R) (5)',
     'Fuel Qty (Trim)',
+    'GLS Mode (*)',
+    'GMT Hour',
+    'GMT Minute',
+    'GMT Second',
+    'GNSS Mode (*)',
+    'GPS Approach',
+    'GPS Hour',
+    'GPS Minute',
+    'GPS Second',
+    'GPS Selected',
+    'Gear (*) Down',
+    'Gear (*) On Ground',
+    'Gear (*) Red Warning',
     'Gear (L) Down',
     'Gear (L) On Ground',
     'Gear (N) Down',
@@ -1336,38 +2571,78 @@ PARAMETERS_DATA_EXPORTS = [
     'Gear Body (R) Down',
     'Gear Body (R) On Ground',
     'Gear Down',
+    'Gear Down (*)',
+    'Gear Down (N)',
     'Gear Down Selected',
     'Gear On Ground',
+    'Gear Selected Down',
+    'Gear Selected Up',
     'Gear Up Selected',
+    'Glidepath Engaged',
     'Global Reference Speed',
     'Global Wheel Speed',
     'Gross Weight',
     'Gross Weight Smoothed',
+    'Ground Station Data Selected (*)',
     'Groundspeed',
+    'Groundspeed (*)',
+    'Groundspeed (FMC)',
     'Groundspeed Velocity',
+    'HUD Approach Warning',
+    'HUD Combiner Position',
     'HUD Configuration',
+    'HUD Flight Path X Position',
+    'HUD Guidance Cue Flight Path Deviation',
+    'HUD ILS Localizer Deviation',
     'HUD Installed',
+    'HUD Roll Absolute Below 6 Deg',
+    'HUD Touchdown',
     'Heading',
+    'Heading (*)',
     'Heading (FO)',
     'Heading Continuous',
     'Heading Discrepancy',
+    'Heading Displayed (Capt)',
     'Heading Increasing',
     'Heading Mag-True (Capt)',
     'Heading Mag-True (FO)',
+    'Heading Mode Engaged',
     'Heading Rate',
     'Heading Selected',
     'Heading Selected (Capt)',
     'Heading Selected (FO)',
+    'Heading Selected Engaged',
     'Heading True',
     'Heading True Continuous',
+    'Heading Up MAP Format (*)',
     'Heading-Track Selected',
     'Headwind',
+    'Hectopascals Selected (*)',
     'High Differential Press Excessive',
     'Hour',
+    'Hyd (*) Electrical',
+    'Hyd (*) Fluid Low',
+    'Hyd (*) Low Press Flight Controls',
+    'Hyd (*) Oil Press',
+    'Hyd (*) Press Alarm',
+    'Hyd (*) Pressure Low',
+    'Hyd (*) Red Display',
+    'Hyd (*) Yellow Display',
     'Hyd (Green) Press',
     'Hyd (Green) Press Low',
     'Hyd (Yellow) Press',
     'Hyd (Yellow) Press Low',
+    'Hyd Oil Press',
+    'Hyd Standby',
+    'Hyd Standby Low Press',
+    'Hyd Standby Oil Press',
+    'IAN Final Approach Course',
+    'IAN Glidepath',
+    'ILS (*) Frequency',
+    'ILS (*) Glideslope',
+    'ILS (*) Localizer',
+    'ILS (*) Mode',
+    'ILS (*) Standby',
     'ILS (1) Frequency',
     'ILS (1) Glideslope',
     'ILS (1) Localizer',
@@ -1376,47 +2651,89 @@ PARAMETERS_DATA_EXPORTS = [
     'ILS (2) Localizer',
     'ILS Frequency',
     'ILS Glideslope',
+    'ILS Glideslope (Elevation)',
+    'ILS Glideslope Active',
+    'ILS Glideslope Engaged',
     'ILS Inner Marker',
+    'ILS Inner Marker (*)',
     'ILS Lateral Distance',
     'ILS Localizer',
+    'ILS Localizer (Azimuth)',
+    'ILS Localizer Active',
+    'ILS Localizer Engaged',
     'ILS Localizer PB Pressed',
+    'ILS Marker Inner',
+    'ILS Marker Middle',
+    'ILS Marker Outer',
     'ILS Middle Marker',
+    'ILS Middle Marker (*)',
     'ILS Outer Marker',
+    'ILS Outer Marker (*)',
+    'ILS Range',
+    'ILS Selected',
+    'ILS-GLS (*) Frequency',
+    'ILS-MLS-GLS (*) Mode Selected',
+    'ILS-VOR (*) Course Selected',
+    'ILS-VOR (*) Frequency',
+    'ILS-VOR Course Selected',
+    'ILS-VOR Frequency',
+    'IRU Navigation Capable',
     'Ice Detector (1) Fault',
     'Ice Detector (2) Fault',
     'Ice Detector Ice Detected',
     'Ice Detector Severe Ice Detected',
+    'In Air',
     'Index',
+    'Key HF (*)',
     'Key HF (1)',
     'Key HF (2)',
+    'Key Satcom (*)',
+    'Key VHF',
+    'Key VHF (*)',
     'Key VHF (1)',
     'Key VHF (2)',
     'Key VHF (3)',
     'Kinetic Energy',
     'LS Selected (Capt)',
     'LS Selected (FO)',
+    'Land (*) (*)',
     'Landing Airport ICAO',
     'Lateral Knob Pulled',
     'Lateral Knob Pushed',
     'Lateral Knob Rotate',
     'Latitude',
+    'Latitude (*)',
+    'Latitude (Coarse)',
     'Latitude IRU',
     'Latitude Prepared',
     'Latitude Smoothed',
+    'Leading Edge Master Extended',
+    'Leading Edge Master In Transit',
     'Level Flight Monitor',
     'Longitude',
+    'Longitude (*)',
+    'Longitude (Coarse)',
     'Longitude IRU',
     'Longitude Prepared',
     'Longitude Smoothed',
     'Loop No (L)',
     'Loop No (R)',
+    'MAP Mode Selected (*)',
+    'MDA Selected (*)',
+    'MLS (*) Mode',
     'MMO Lookup',
     'Mach',
     'Mach Selected',
+    'Mach Selected (*)',
     'Mach Selected (FG)',
+    'Mach Selected (FMC)',
     'Magnetic Track Angle',
     'Magnetic Variation',
     'Magnetic Variation From Runway',
+    'Main Gearbox Oil Press',
+    'Main Gearbox Oil Press (*)',
+    'Main Gearbox Oil Temp',
+    'Main Gearbox Oil Temp (*)',
     'Main Landing Gear Bay Fire',
     'Manual Pitch Trim Down Command',
     'Manual Pitch Trim Up Command',
@@ -1430,35 +2747,73 @@ PARAMETERS_DATA_EXPORTS = [
     'Master Warning (Capt)',
     'Master Warning (FO)',
     'Master caution',
+    'Meters (*) Selected',
     'Metric Altitude Selected',
     'Minute',
+    'Mode Control Panel Speed (*)',
     'Month',
+    'NAV Database Effectivity (*) Day',
+    'NAV Mode Active',
+    'NAV Mode Operational (*)',
+    'NAV/VOR Select',
     'Negative Differential Press Excessive',
+    'No Autoland Advisory',
     'Nose Wheel Steering COM Angle',
     'Nose Wheel Steering Demand Angle',
     'Nose Wheel Steering MON Angle',
     'Nose Wheel Steering Order',
     'Nose Wheel Steering Rudder Pedal Order',
+    'Nr (*)',
+    'Nr (1)',
+    'On Ground',
+    'Origin',
+    'Overspeed Warning',
+    'PFD Navigation Display Format (*)',
     'PRIM Instinctive Disconnect',
     'PRIM N1 Target Inboard Engines',
     'PRIM N1 Target Outboard Engines',
+    'Para-Visual Display (*) Enabled',
+    'Para-Visual Display (*) On',
+    'Para-Visual Display Enabled',
     'Pilot Flying',
     'Pitch',
+    'Pitch (*)',
+    'Pitch (Capt)',
+    'Pitch (FO)',
+    'Pitch Command (*)',
     'Pitch Discrepancy',
     'Pitch Equivalent Order',
     'Pitch Rate',
+    'Pitch Trim',
     'Pitch Trim Double Pressurization',
     'Pitch Unfiltered',
+    'Plan Mode Selected (*)',
+    'Position Data Selected (*)',
     'Potential Energy',
+    'Primary Flight Display No Autoland',
     'Primary Flight Phase',
     'Prog Ident',
+    'Range Seelcted',
+    'Range Seelcted (*)',
+    'Range Selected (*)',
     'Reactive Windshear',
     'Relief',
+    'Rob Display Unit Format',
     'Roll',
+    'Roll (*)',
+    'Roll (Capt)',
+    'Roll (FO)',
     'Roll Discrepancy',
     'Roll Equivalent Order',
     'Roll Rate',
+    'Roll Trim Command Wing (*) Down',
+    'Roll Trim Command Wing (L) Down',
+    'Roll Trim Command Wing (R) Down',
     'Roll Unfiltered',
+    'Rollout Armed',
+    'Rollout Engaged',
+    'Rotor Brake Engaged',
+    'Route Data Selected (*)',
     'Rudder',
     'Rudder (Lower)',
     'Rudder (Lower) Actuator (1) Available',
@@ -1471,6 +2826,9 @@ PARAMETERS_DATA_EXPORTS = [
     'Rudder (Upper) Double Pressurization',
     'Rudder (Upper) Travel Limit',
     'Rudder Pedal',
+    'Rudder Pedal Force',
+    'Rudder Reversal',
+    'Rudder Trim',
     'SAT',
     'SAT (1)',
     'SAT (2)',
@@ -1484,17 +2842,33 @@ PARAMETERS_DATA_EXPORTS = [
     'Side Slip Angle Indicated',
     'Sidestick Angle (Capt)',
     'Sidestick Angle (FO)',
+    'Sidestick Pitch (*)',
     'Sidestick Pitch (Capt)',
     'Sidestick Pitch (FO)',
+    'Sidestick Roll (*)',
     'Sidestick Roll (Capt)',
     'Sidestick Roll (FO)',
+    'Single Channel Engaged',
     'Slat',
+    'Slat (*) Extended',
+    'Slat (*) Fully Extended',
+    'Slat (*) In Transit',
+    'Slat (*) Outboard Extended',
     'Slat Angle',
+    'Slat Angle (*)',
     'Slat Excluding Transition',
+    'Slat Fully Extended',
     'Slat Including Transition',
     'Slat Lever',
+    'Slat Part Extended',
+    'Sling Load Force',
     'Slope Angle To Landing',
     'Slope To Landing',
+    'Smoke Cargo Aft Warning',
+    'Smoke Lavatory Warning',
+    'Smoke Warning Lavatory',
+    'Speed Control',
+    'Speed Hold Units',
     'Speed Knob Pulled',
     'Speed Knob Pushed',
     'Speed Knob Rotate',
@@ -1502,16 +2876,29 @@ PARAMETERS_DATA_EXPORTS = [
     'Speedbrake Armed',
     'Speedbrake Commanded',
     'Speedbrake Deployed',
+    'Speedbrake Do Not Arm',
     'Speedbrake Handle',
     'Speedbrake Handle Position',
     'Speedbrake Selected',
+    'Spoiler',
+    'Spoiler (*)',
     'Spoiler (1 and 3) Available',
     'Spoiler (1)',
+    'Spoiler (10)',
+    'Spoiler (11)',
+    'Spoiler (12)',
     'Spoiler (2 and 4) Available',
     'Spoiler (2)',
     'Spoiler (3)',
     'Spoiler (4)',
+    'Spoiler (5)',
+    'Spoiler (6)',
+    'Spoiler (7)',
+    'Spoiler (8)',
+    'Spoiler (9)',
     'Stabilizer',
+    'Stabilizer Manual Trim Down',
+    'Stabilizer Manual Trim Up',
     'Stable Approach',
     'Standard Altitude Discrepancy',
     'Stationary',
@@ -1519,34 +2906,86 @@ PARAMETERS_DATA_EXPORTS = [
     'Stator Vane (R)',
     'Steering Hand Wheel Order (Capt)',
     'Steering Hand Wheel Order (FO)',
+    'Stick Pusher',
+    'Stick Shaker',
+    'Stick Shaker (*)',
     'Superframe Counter',
+    'System Push button Selected',
     'TAT',
+    'TAT (*)',
+    'TAWS Alert',
     'TAWS Alert Message Matrix',
+    'TAWS Alert Recorded',
+    'TAWS Caution',
+    'TAWS Caution Terrain',
     'TAWS Display',
+    'TAWS Dont Sink',
     'TAWS Failed',
+    'TAWS General',
+    'TAWS Glideslope',
+    'TAWS Glideslope Cancel',
     'TAWS Inhibit',
+    'TAWS Inoperative',
+    'TAWS Minimums',
+    'TAWS Obstacle',
+    'TAWS Obstacle Caution',
+    'TAWS Obstacle Warning',
+    'TAWS Predictive Windshear',
+    'TAWS Pull Up',
+    'TAWS Sink Rate',
+    'TAWS Terrain',
+    'TAWS Terrain Ahead',
+    'TAWS Terrain Ahead Pull Up',
     'TAWS Terrain Awareness Failed',
+    'TAWS Terrain Awareness Inoperative',
+    'TAWS Terrain Awareness Not Available',
+    'TAWS Terrain Caution',
+    'TAWS Terrain Display Selected (Capt)',
+    'TAWS Terrain Display Selected (FO)',
     'TAWS Terrain Mode',
     'TAWS Terrain Obstacle Awareness Caution',
     'TAWS Terrain Obstacle Awareness Warning',
+    'TAWS Terrain Override',
+    'TAWS Terrain Pull Up',
+    'TAWS Terrain Warning',
+    'TAWS Too Low Flap',
+    'TAWS Too Low Gear',
+    'TAWS Too Low Terrain',
     'TAWS Unspecified',
+    'TAWS V1 Callout Enabled (*)',
     'TAWS Warning',
+    'TAWS Windshear',
+    'TAWS Windshear Caution',
+    'TAWS Windshear Caution 2',
+    'TAWS Windshear Inoperative',
+    'TAWS Windshear Warning',
+    'TAWS Windshear Warning 2',
     'TCAFVALIDATED_EECRRL_T 1Hz_1166',
     'TCAFVALIDATED_EECRRR_T 1Hz_1167',
     'TCARVALIDATED_EECRRL_T 1Hz_1168',
     'TCARVALIDATED_EECRRR_T 1Hz_1169',
+    'TCAS Advisory Rate to Maintain',
+    'TCAS Altitude Rate Advisory',
+    'TCAS Altitude Reporting',
+    'TCAS Altitude Selected',
     'TCAS Combined Control',
     'TCAS Down Advisory',
+    'TCAS Sensitivity Level',
     'TCAS Sensitivity Level Control',
+    'TCAS System Status',
     'TCAS Up Advisory',
     'TCAS Vertical Control',
+    'TFC Selected (*)',
     'THS Actuator (1) Available',
     'THS Actuator (2) Available',
     'THS Actuator (3) Available',
     'TMC VNAV Operating',
     'Tail Number',
+    'Tail Rotor Pedal (*)',
+    'Tail Rotor Pedal Output (*)',
     'Tailwind',
     'Takeoff Airport ICAO',
+    'Takeoff And Go Around',
     'Takeoff Configuration Flap Warning',
     'Takeoff Configuration Rudder Trim Warning',
     'Takeoff Configuration Slat Warning',
@@ -1555,6 +2994,9 @@ PARAMETERS_DATA_EXPORTS = [
     'Takeoff Datetime',
     'Takeoff Thrust Disagree',
     'Takeoff Weight',
+    'Test Pattern',
+    'Throttle Lever',
+    'Throttle Lever Angle (*)',
     'Throttle Levers',
     'Thrust Asymmetry',
     'Thrust Reversers',
@@ -1562,20 +3004,36 @@ PARAMETERS_DATA_EXPORTS = [
     'Time',
     'Track',
     'Track Angle Rate',
+    'Track Continuous',
     'Track Deviation From Runway',
+    'Track Selected',
     'Track True',
+    'Track True Continuous',
     'True Track Angle',
     'Turbulence',
+    'V1',
+    'V2',
+    'VLS',
     'VMO Lookup',
+    'VMO-MMO Alternate (*)',
+    'VOR (*) Frequency',
+    'VOR (*) Selected (*)',
     'VOR (1) Bearing',
     'VOR (1) Course Selected',
     'VOR (1) Frequency',
     'VOR (2) Bearing',
     'VOR (2) Course Selected',
     'VOR (2) Frequency',
+    'VOR Mode Selected (*)',
+    'VORLOC Engaged',
+    'VR',
     'VS Knob Pulled',
     'VS Knob Rotate',
+    'Vapp',
+    'Variable Bleed Valve (*)',
+    'Vertical Navigation Engaged',
     'Vertical Speed',
+    'Vertical Speed Engaged',
     'Vertical Speed For Flight Phases',
     'Vertical Speed GPS',
     'Vertical Speed Inertial',
@@ -1586,6 +3044,8 @@ PARAMETERS_DATA_EXPORTS = [
     'WBBC Aft CofG Warning',
     'WBBC CofG',
     'WBBC Weight',
+    'WPT Selected (*)',
+    'WXR Selected (*)',
     'Wheel Speed',
     'Wheel Speed (C) (1)',
     'Wheel Speed (C) (2)',
@@ -1609,6 +3069,7 @@ PARAMETERS_DATA_EXPORTS = [
     'Wheel Speed (R) (6)',
     'Wheel Speed (R) (7)',
     'Wheel Speed (R) (8)',
+    'Wheel Well Fire',
     'Wind Across Landing Runway',
     'Wind Direction',
     'Wind Direction Continuous',
@@ -1617,15 +3078,14 @@ PARAMETERS_DATA_EXPORTS = [
     'Wind Speed',
     'Wing (L) Anti Ice Valve',
     'Wing (R) Anti Ice Valve',
+    'Wing Anti Ice',
     'Yaw',
+    'Yaw Damper Engaged',
+    'Yaw Rate (*)',
+    'Yaw Trim',
+    'Yaw Trim (*) Command',
     'Yaw Trim Position',
     'Year',
     'Zero Fuel Weight',
+    'inHg Selected (*)',
 ]
-
-# List of all parameters from all files with duplicates removed.
-PARAMETERS_FROM_FILES = list(set(
-    PARAMETERS_PATTERNS +
-    PARAMETERS_VIS +
-    PARAMETERS_DATA_EXPORTS
-))
@@ -0,0 +1,178 @@
+import mock
+import numpy as np
+import unittest
+
+from hdfaccess import downsample as downsample_module
+from hdfaccess.downsample import _data_kind, _masked_buckets, downsample
+from hdfaccess.parameter import MappedArray
+
+
+class TestDownsample(unittest.TestCase):
+    def test_downsample_array(self):
+        array = np.arange(100)
+        np.testing.assert_array_equal(downsample(array, 50), [0, 49, 50, 99])
+        np.testing.assert_array_equal(downsample(array[::-1], 50), [99, 50, 49, 0])
+
+    def test_downsample_list(self):
+        result = downsample(list(range(100)), 50)
+        self.assertIsInstance(result, np.ndarray)
+        np.testing.assert_array_equal(result, [0, 49, 50, 99])
+
+    def test_downsample_array_not_interleaved(self):
+        minimums, maximums = downsample(np.arange(100)[::-1], 50, interleave=False)
+        np.testing.assert_array_equal(minimums, [50, 0])
+        np.testing.assert_array_equal(maximums, [99, 49])
+
+    def test_downsample_nothing_to_reduce(self):
+        array = np.arange(6.0)
+        self.assertIs(downsample(array, 2), array)
+        short = np.ma.arange(2)
+        self.assertIs(downsample(short, 10), short)
+
+    def test_downsample_integers_not_interleaved(self):
+        array = np.array([5, 1, 9, 3, 7, 2, 8], dtype=np.int16)
+        minimums, maximums = downsample(array, 3, interleave=False)
+        self.assertEqual(minimums.dtype, np.int16)
+        np.testing.assert_array_equal(minimums, [1, 2, 8])
+        np.testing.assert_array_equal(maximums, [9, 7, 8])
+
+    def test_downsample_out(self):
+        out = np.empty(4, dtype=np.int64)
+        result = downsample(np.arange(100, dtype=np.int64), 50, out=out)
+        self.assertIs(result, out)
+        np.testing.assert_array_equal(out, [0, 49, 50, 99])
+        masked_out = np.ma.empty(4, dtype=np.float64)
+        array = np.ma.arange(100.0)
+        array[:50] = np.ma.masked
+        result = downsample(array, 50, out=masked_out)
+        self.assertIs(result, masked_out)
+        self.assertEqual(masked_out.mask.tolist(), [True, True, False, False])
+        self.assertEqual(masked_out[2:].tolist(), [50, 99])
+        self.assertRaises(ValueError, downsample, np.arange(100), 50, out=np.empty(3, dtype=np.int64))
+        self.assertRaises(ValueError, downsample, array, 50, out=np.empty(4))
+        self.assertRaises(ValueError, downsample, array, 50, interleave=False, out=masked_out)
+
+    def test_downsample_bucket_size_two(self):
+        # buckets of two values are only returned unchanged when every value is valid and there is no remainder
+        np.testing.assert_array_equal(downsample(np.array([1.0, np.nan, 3.0, 4.0, np.inf, 6.0]), 2),
+                                      [1.0, 1.0, 3.0, 4.0, 6.0, 6.0])
+        result = downsample(np.ma.array([1, 2, 3, 4, 5, 6], mask=[0, 1, 0, 0, 1, 1]), 2)
+        np.testing.assert_array_equal(result.data[:4], [1, 1, 3, 4])
+        np.testing.assert_array_equal(result.mask, [0, 0, 0, 0, 1, 1])
+        np.testing.assert_array_equal(downsample(np.array([5, 1, 9]), 2), [5, 1, 9, 9])
+        np.testing.assert_array_equal(downsample(np.array([7.0]), 2), [7.0, 7.0])
+        np.testing.assert_array_equal(downsample(np.array([8, 7, 6, 5]), 1), [8, 8, 7, 7, 6, 6, 5, 5])
+
+    def test_downsample_array_remainder(self):
+        array = np.array([5, 1, 9, 3, 7, 2, 8])
+        np.testing.assert_array_equal(downsample(array, 3), [1, 9, 7, 2, 8, 8])
+
+    def test_downsample_array_masked(self):
+        array = np.ma.arange(100)
+        array[:50] = np.ma.masked
+        array[60:70] = np.ma.masked
+        result = downsample(array, 50)
+        self.assertTrue(result[0] is np.ma.masked)
+        self.assertTrue(result[1] is np.ma.masked)
+        self.assertEqual(result[2:].tolist(), [50, 99])
+
+    def test_downsample_array_masked_nothing_or_everything(self):
+        array = np.ma.array(np.arange(10.0), mask=False)
+        result = downsample(array, 4)
+        self.assertEqual(result.tolist(), [0, 3, 4, 7, 8, 9])
+        array.mask = True
+        result = downsample(array, 4)
+        self.assertEqual(len(result), 6)
+        self.assertTrue(result.mask.all())
+
+    def test_downsample_array_masked_integer(self):
+        array = np.ma.array([4, 1, 7, 3, 9, 2], mask=[0, 1, 0, 0, 1, 0])
+        result = downsample(array, 3)
+        self.assertEqual(result.tolist(), [4, 7, 3, 2])
+        self.assertFalse(result.mask.any())
+
+    def test_downsample_array_strings(self):
+        array = np.array(['b', 'a', 'c', 'b', 'd', 'a'])
+        np.testing.assert_array_equal(downsample(array, 3), ['a', 'c', 'd', 'a'])
+
+    def test_downsample_array_invalid(self):
+        array = np.array([1.0, np.nan, 3.0, -np.inf, 2.0, 0.5])
+        np.testing.assert_array_equal(downsample(array, 3), [1.0, 3.0, 2.0, 0.5])
+
+    def test_downsample_point_size(self):
+        array = np.arange(12)
+        np.testing.assert_array_equal(downsample(array, 1, point_size=2), array)
+        np.testing.assert_array_equal(downsample(array, 3, point_size=2), [0, 5, 6, 11])
+
+    @mock.patch.object(downsample_module, '_bucket_extremes', None)
+    @mock.patch.object(downsample_module, 'TILE_BYTES', 64)
+    def test_downsample_tiles(self):
+        array = np.ma.array(np.sin(np.arange(1003)), mask=np.arange(1003) % 7 == 0)
+        with mock.patch.object(downsample_module, 'TILE_BYTES', 1024 * 1024):
+            expected = downsample(array, 3)
+        result = downsample(array, 3)
+        np.testing.assert_array_equal(result, expected)
+        np.testing.assert_array_equal(result.mask, expected.mask)
+
+    def test_downsample_masked_fill_values(self):
+        # valid integers equal to the largest or smallest value of the dtype next to masked values
+        array = np.ma.array(np.array([5, 7, 0, 3, 255, 1, 9, 4], dtype=np.uint8), mask=[1, 1, 0, 1, 0, 1, 1, 1])
+        for bucket_extremes in (downsample_module._bucket_extremes, None):
+            with mock.patch.object(downsample_module, '_bucket_extremes', bucket_extremes):
+                result = downsample(array, 4)
+                self.assertEqual(result.tolist(), [0, 0, 255, 255])
+                result = downsample(array, 3)
+                self.assertEqual(result.tolist(), [0, 0, 255, 255, None, None])
+                self.assertEqual(result.data[4:].tolist(), [9, 9])
+
+    @unittest.skipIf(downsample_module._bucket_extremes is None, 'numba is not installed')
+    def test_downsample_numba_matches_numpy(self):
+        rng = np.random.RandomState(0)
+        for dtype in (np.float64, np.float32, np.int64, np.int16, np.uint8):
+            array = (rng.random_sample(1003) * 100).astype(dtype)
+            if array.dtype.kind == 'f':
+                array[::7] = np.nan
+                array[5:40] = np.nan
+                array[::11] = np.inf
+            masked = np.ma.array(array, mask=rng.random_sample(1003) < 0.3)
+            masked[100:200] = np.ma.masked
+            for bucket_size in (3, 10, 64):
+                for data in (array, masked):
+                    result = downsample(data, bucket_size)
+                    with mock.patch.object(downsample_module, '_bucket_extremes', None):
+                        expected = downsample(data, bucket_size)
+                    np.testing.assert_array_equal(np.ma.getmaskarray(result), np.ma.getmaskarray(expected))
+                    np.testing.assert_array_equal(np.ma.filled(result, 0), np.ma.filled(expected, 0))
+
+    def test_downsample_numba_dtypes(self):
+        for dtype in (np.float16, '>f8', '>i2', np.int32, np.uint16):
+            array = np.ma.array(np.arange(10).astype(dtype), mask=np.arange(10) % 4 == 0)
+            with mock.patch.object(downsample_module, '_bucket_extremes') as bucket_extremes:
+                result = downsample(array, 5)
+            # only the native dtypes the kernels are tested with are reduced with numba
+            bucket_extremes.assert_not_called()
+            np.testing.assert_array_equal(result, [1, 3, 5, 9])
+            self.assertEqual(result.dtype, np.dtype(dtype))
+
+
+class TestDataKind(unittest.TestCase):
+    def test_data_kind(self):
+        self.assertEqual(_data_kind([1, 2]), 'sequence')
+        self.assertEqual(_data_kind((1, 2)), 'sequence')
+        self.assertEqual(_data_kind(np.arange(2)), 'array')
+        self.assertEqual(_data_kind(np.ma.arange(2)), 'masked')
+        self.assertEqual(_data_kind(MappedArray([1], values_mapping={1: 'one'})), 'masked')
+        self.assertIsNone(_data_kind('12'))
+
+
+class TestMaskedBuckets(unittest.TestCase):
+    def test_masked_buckets(self):
+        mask = np.zeros(100, dtype=bool)
+        mask[:16] = True
+        mask[20] = True
+        mask[96:] = True
+        for bucket_size in (8, 16, 5, 7):
+            all_masked, any_masked = _masked_buckets(mask, bucket_size)
+            starts = range(0, 100, bucket_size)
+            self.assertEqual(all_masked.tolist(), [mask[s:s + bucket_size].all() for s in starts])
+            self.assertEqual(any_masked.tolist(), [mask[s:s + bucket_size].any() for s in starts])
@@ -3,6 +3,7 @@ import h5py
 import mock
 import numpy as np
 import os
+import pathlib
 import pytz
 import random
 import simplejson
@@ -431,6 +432,26 @@ class TestHdfFile(unittest.TestCase):
         self.assertEqual(hdf.hdfaccess_version, 1)
         os.remove(temp)
 
+    def test_create_file_h5py_kwargs(self):
+        temp = 'temp_new_file.hdf5'
+        if os.path.exists(temp):
+            os.remove(temp)
+        hdf = hdf_file(temp, create=True, rdcc_nbytes=4 * 1024 * 1024,
+                       rdcc_nslots=521)
+        cache = hdf.hdf.id.get_access_plist().get_cache()
+        self.assertEqual(cache[1:3], (521, 4 * 1024 * 1024))
+        hdf.close()
+        os.remove(temp)
+
+    def test_create_file_path_like(self):
+        temp = pathlib.Path('temp_new_file.hdf5')
+        if temp.exists():
+            temp.unlink()
+        hdf = hdf_file(temp, create=True)
+        self.assertEqual(hdf.file_path, os.path.abspath(str(temp)))
+        hdf.close()
+        temp.unlink()
+
     def test_set_and_get_attributes(self):
         # Test setting a datetime as it's a non-json non-string type.
         self.assertFalse(self.hdf_file.hdf.attrs.get('start_datetime'))
@@ -0,0 +1,224 @@
+import h5py
+import logging
+import mock
+import numpy as np
+import os
+import unittest
+
+from hdfaccess.file import hdf_file
+from hdfaccess.parameter import MappedArray, Parameter
+from hdfaccess.tools import hdfvalidator
+from hdfaccess.tools.hdfvalidator import (
+    HDFValidatorHandler,
+    LogRecordCollector,
+    chunk_layout,
+    validate_chunk_layout,
+    validate_file,
+)
+
+TEST_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_data')
+
+
+class TestValidateChunkLayout(unittest.TestCase):
+
+    def setUp(self):
+        self.hdf_path = os.path.join(TEST_DATA_DIR, 'test_hdf_validator_chunks.hdf5')
+        with h5py.File(self.hdf_path, 'w') as hdf:
+            series = hdf.create_group('series')
+            group = series.create_group('Chunked')
+            group.create_dataset('data', data=np.arange(100, dtype=np.float64), chunks=(25,))
+            group.create_dataset('mask', data=np.zeros(100, dtype=bool), chunks=(50,))
+            group = series.create_group('Contiguous')
+            group.create_dataset('data', data=np.arange(100, dtype=np.float64))
+            group.create_dataset('mask', data=np.zeros(100, dtype=bool))
+            group = series.create_group('Compressed')
+            group.create_dataset('data', data=np.zeros(1000), chunks=(1000,), compression='gzip')
+            group = series.create_group('Unallocated')
+            dataset = group.create_dataset('data', shape=(100,), dtype=np.float64, chunks=(25,))
+            dataset[:30] = 1
+        self.hdf = hdf_file(self.hdf_path, read_only=True)
+        self.collector = LogRecordCollector()
+        self.counter = HDFValidatorHandler()
+        self.level = hdfvalidator.LOGGER.level
+        hdfvalidator.LOGGER.addHandler(self.collector)
+        hdfvalidator.LOGGER.addHandler(self.counter)
+        hdfvalidator.LOGGER.setLevel(logging.DEBUG)
+
+    def tearDown(self):
+        hdfvalidator.LOGGER.removeHandler(self.collector)
+        hdfvalidator.LOGGER.removeHandler(self.counter)
+        hdfvalidator.LOGGER.setLevel(self.level)
+        self.hdf.close()
+        os.remove(self.hdf_path)
+
+    def _messages(self):
+        return [(record.levelname, record.msg) for record in self.collector.records]
+
+    def test_chunk_layout(self):
+        series = self.hdf.hdf['series']
+        self.assertEqual(chunk_layout(series['Chunked']['data']), (4, 800))
+        self.assertEqual(chunk_layout(series['Chunked']['mask']), (2, 100))
+        self.assertEqual(chunk_layout(series['Unallocated']['data']), (2, 400))
+        allocated, stored_size = chunk_layout(series['Compressed']['data'])
+        self.assertEqual(allocated, 1)
+        self.assertLess(stored_size, series['Compressed']['data'].nbytes)
+
+    def test_chunk_layout_get_chunk_info(self):
+        # h5py/HDF5 without H5Dchunk_iter look up each chunk by index.
+        for name in ('Chunked', 'Compressed', 'Unallocated'):
+            dataset = self.hdf.hdf['series'][name]['data']
+            dsid = mock.Mock(spec=['get_num_chunks', 'get_chunk_info'],
+                             get_num_chunks=dataset.id.get_num_chunks,
+                             get_chunk_info=dataset.id.get_chunk_info)
+            self.assertEqual(chunk_layout(mock.Mock(id=dsid)), chunk_layout(dataset))
+
+    def test_chunk_layout_unavailable(self):
+        self.assertIsNone(chunk_layout(mock.Mock(id=mock.Mock(spec=[]))))
+
+    def test_validate_chunk_layout_chunked(self):
+        validate_chunk_layout(self.hdf, 'Chunked')
+        self.assertEqual(self._messages(), [
+            ('INFO', 'Checking dataset chunk layout.'),
+            ('INFO', "'data' dataset is stored in 4 chunks of (25,) using 800 bytes."),
+            ('INFO', "'mask' dataset is stored in 2 chunks of (50,) using 100 bytes."),
+        ])
+        self.assertEqual(self.counter.get_error_counts(), {'warnings': 0, 'errors': 0})
+
+    def test_validate_chunk_layout_contiguous(self):
+        validate_chunk_layout(self.hdf, 'Contiguous')
+        self.assertEqual(self._messages(), [
+            ('INFO', 'Checking dataset chunk layout.'),
+            ('INFO', "'data' dataset is stored contiguously."),
+            ('INFO', "'mask' dataset is stored contiguously."),
+        ])
+        self.assertEqual(self.counter.get_error_counts(), {'warnings': 0, 'errors': 0})
+
+    def test_validate_chunk_layout_compressed(self):
+        validate_chunk_layout(self.hdf, 'Compressed')
+        _, stored_size = chunk_layout(self.hdf.hdf['series']['Compressed']['data'])
+        self.assertEqual(self._messages(), [
+            ('INFO', 'Checking dataset chunk layout.'),
+            ('INFO', "'data' dataset is stored in 1 chunks of (1000,) using %s bytes." % stored_size),
+        ])
+        self.assertEqual(self.counter.get_error_counts(), {'warnings': 0, 'errors': 0})
+
+    def test_validate_chunk_layout_unallocated(self):
+        validate_chunk_layout(self.hdf, 'Unallocated')
+        self.assertEqual(self._messages(), [
+            ('INFO', 'Checking dataset chunk layout.'),
+            ('WARNING', "'data' dataset has 2 of 4 chunks allocated. Unallocated chunks will be read as the "
+                        "fill value."),
+        ])
+        self.assertEqual(self.counter.get_error_counts(), {'warnings': 1, 'errors': 0})
+
+    def test_validate_chunk_layout_unavailable(self):
+        with mock.patch.object(hdfvalidator, 'chunk_layout', return_value=None):
+            validate_chunk_layout(self.hdf, 'Chunked')
+        self.assertEqual(self._messages(), [
+            ('INFO', 'Checking dataset chunk layout.'),
+            ('DEBUG', 'Chunk information is not available with this version of h5py/HDF5.'),
+        ])
+        self.assertEqual(self.counter.get_error_counts(), {'warnings': 0, 'errors': 0})
+
+
+class TestValidateFile(unittest.TestCase):
+
+    def setUp(self):
+        self.hdf_path = os.path.join(TEST_DATA_DIR, 'test_hdf_validator_jobs.hdf5')
+        with hdf_file(self.hdf_path, create=True) as hdf:
+            hdf.duration = 100
+            hdf.reliable_frame_counter = False
+            hdf.reliable_subframe_counter = False
+            hdf.superframe_present = False
+            hdf.start_datetime = 1500000000.0
+            for index, name in enumerate(('Airspeed', 'Altitude STD', 'Heading', 'Unknown A', 'Unknown B')):
+                frequency = index % 2 + 1
+                array = np.ma.arange(100.0 * frequency)
+                array[3] = np.nan
+                array[5] = np.ma.masked
+                hdf.set_param(Parameter(name, array, frequency=frequency, units='kt', data_type='Signed',
+                                        lfl=True, offset=0.0))
+            hdf.set_param(Parameter('Gear Down', MappedArray([0, 1, 1, 0] * 25, values_mapping={0: 'Up', 1: 'Down'}),
+                                    frequency=1, data_type='Discrete', lfl=False, offset=0))
+            hdf.set_param(Parameter('Label', np.ma.zeros(100), frequency=1, data_type='ASCII', lfl=True,
+                                    offset=0.0))
+        self.level = hdfvalidator.LOGGER.level
+        hdfvalidator.LOGGER.setLevel(logging.DEBUG)
+
+    def tearDown(self):
+        hdfvalidator.LOGGER.setLevel(self.level)
+        os.remove(self.hdf_path)
+
+    def _validate(self, **kwargs):
+        collector = LogRecordCollector()
+        counter = HDFValidatorHandler()
+        hdfvalidator.LOGGER.addHandler(collector)
+        hdfvalidator.LOGGER.addHandler(counter)
+        try:
+            with mock.patch.object(hdfvalidator, 'parameter_list',
+                                   return_value=['Airspeed', 'Altitude STD', 'Heading']):
+                validate_file(self.hdf_path, **kwargs)
+        finally:
+            hdfvalidator.LOGGER.removeHandler(collector)
+            hdfvalidator.LOGGER.removeHandler(counter)
+        records = [(record.levelname, record.msg) for record in collector.records]
+        return records, counter.get_error_counts()
+
+    def test_validate_file_jobs(self):
+        records, counts = self._validate(jobs=1)
+        self.assertIn(('INFO', "Checking Parameter: 'Gear Down'"), records)
+        self.assertTrue(counts['errors'])
+        self.assertTrue(counts['warnings'])
+        self.assertEqual(self._validate(jobs=2), (records, counts))
+
+    def test_validate_file_jobs_names(self):
+        names = ['Airspeed', 'Gear Down', 'Unknown B']
+        records, counts = self._validate(names=names, jobs=1)
+        self.assertNotIn(('INFO', "Checking Parameter: 'Heading'"), records)
+        self.assertEqual(self._validate(names=names, jobs=2), (records, counts))
+
+    def test_validate_file_units_required(self):
+        records, _ = self._validate(names=['Gear Down', 'Label'])
+        # units are required for every parameter, including discrete and ASCII parameters
+        self.assertIn(('ERROR', "Parameter attribute 'units' not present for 'Gear Down' and is Required."), records)
+        self.assertIn(('ERROR', "Parameter attribute 'units' not present for 'Label' and is Required."), records)
+
+
+class TestValidateParametersWorker(unittest.TestCase):
+
+    def setUp(self):
+        self.hdf_path = os.path.join(TEST_DATA_DIR, 'test_hdf_validator_worker.hdf5')
+        with h5py.File(self.hdf_path, 'w') as hdf:
+            hdf.create_group('series')
+        root = logging.getLogger()
+        self.root_state = (root.handlers, root.level)
+        self.logger_state = (hdfvalidator.LOGGER, hdfvalidator.LOGGER.handlers, hdfvalidator.LOGGER.propagate,
+                             hdfvalidator.LOGGER.level)
+
+    def tearDown(self):
+        root = logging.getLogger()
+        root.handlers, root.level = self.root_state
+        logger, logger.handlers, logger.propagate, logger.level = self.logger_state
+        hdfvalidator.LOGGER = logger
+        hdfvalidator._WORKER_HDF.close()
+        hdfvalidator._WORKER_HDF = hdfvalidator._WORKER_COLLECTOR = None
+        os.remove(self.hdf_path)
+
+    def test_validate_parameters_worker_records(self):
+        def validate_parameter(hdf, name, matched, **kwargs):
+            hdfvalidator.LOGGER.info('Validating %s', name)
+            hdfvalidator.LOGGER.debug('Below the level of the validator logger')
+            logging.getLogger('hdfaccess.file').warning('Reading %s', name)
+            logging.info('Below the level of the root logger')
+
+        with mock.patch('multiprocessing.util.Finalize'):
+            hdfvalidator._init_parameters_worker(self.hdf_path, '__main__', logging.INFO, logging.WARNING)
+        with mock.patch.object(hdfvalidator, 'validate_parameter', validate_parameter):
+            records = hdfvalidator._validate_parameters_worker((['A', 'B'], frozenset(), {}, None, False))
+        # records of other loggers are collected as a sequential run would emit them through the root logger
+        self.assertEqual([(record.name, record.levelname, record.msg) for record in records], [
+            ('__main__', 'INFO', 'Validating A'),
+            ('hdfaccess.file', 'WARNING', 'Reading A'),
+            ('__main__', 'INFO', 'Validating B'),
+            ('hdfaccess.file', 'WARNING', 'Reading B'),
+        ])